@@ -2,21 +2,83 @@
 Main Telegram bot module for the Mini Dungeon Master RPG.
 """
 
+import asyncio
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
+
+try:
+    from telegram.ext import AIORateLimiter
+except ImportError:  # requires python-telegram-bot[rate-limiter]
+    AIORateLimiter = None
 from database import DatabaseManager
 from game_engine import GameEngine
 from llm_client import LLMClient
 import config
 
-# Set up logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
 logger = logging.getLogger(__name__)
 
+# Static message text and keyboards, built once at import time
+HELP_TEXT = """
+🎮 *Mini Dungeon Master - Help* 🎮
+
+*Available Commands:*
+
+/start - Begin your adventure
+/status - Check your character stats
+/explore - Explore the world and find encounters
+/inventory - View your items
+/attack - Attack during combat
+/use <item> - Use an item from your inventory
+/help - Show this help message
+
+*How to Play:*
+• Use /start to begin your adventure
+• Use /explore to discover new areas and encounters
+• During combat, use /attack to fight enemies
+• Use /use <item_name> to use items from your inventory
+• Make choices using the numbered buttons or by typing "1", "2", etc.
+
+*Game Features:*
+• Level up by gaining experience
+• Find items and equipment
+• Battle various enemies
+• Make story choices that affect your journey
+• Persistent character progression
+
+*Tips:*
+• Keep your health high by using healing items
+• Explore regularly to find new items and encounters
+• Choose your battles wisely!
+"""
+
+COMBAT_CONTINUE_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("⚔️ Attack", callback_data="attack")],
+    [InlineKeyboardButton("🎒 Use Item", callback_data="use_item")]
+])
+
+CANCEL_MSG = "❌ Action cancelled."
+
+# Valid free-text choice replies, mapped to their choice number
+_CHOICE_MAP = {"1": 1, "2": 2, "3": 3, "4": 4}
+
+
+def _choices_markup(choices):
+    """Build the numbered-choices inline keyboard for a list of choices."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")]
+        for i, choice in enumerate(choices, 1)
+    ])
+
 
 class DungeonMasterBot:
     """Main bot class for the Mini Dungeon Master RPG."""
@@ -24,14 +86,111 @@ class DungeonMasterBot:
     def __init__(self):
         """Initialize the bot with all necessary components."""
         self.db_manager = DatabaseManager()
+        self.db_manager.apply_pragmas()
         self.llm_client = LLMClient()
         self.game_engine = GameEngine(self.db_manager, self.llm_client)
+
+        # Game-engine calls hit SQLite and the LLM synchronously; run them in
+        # a thread pool so one slow call doesn't block the whole event loop.
+        self._executor = ThreadPoolExecutor(max_workers=config.WORKERS)
+
+        # Per-chat work queues: updates from the same chat are processed in
+        # order, while different chats run concurrently.
+        self._chat_queues = {}
+
+        # Short-lived player-status cache so chained callbacks (e.g. the
+        # use-item flow) don't re-read the database within the same moment.
+        self._status_cache = {}
+
+        # Last payload sent per edited message. Telegram strips entities
+        # from message.text, so Markdown source can't be compared against
+        # the displayed text; this remembers what we actually sent.
+        self._last_edit = {}
         
         # Initialize the Telegram application
-        self.application = Application.builder().token(config.TELEGRAM_TOKEN).build()
-        
+        builder = (
+            Application.builder()
+            .token(config.TELEGRAM_TOKEN)
+            .post_init(self._post_init)
+        )
+        if AIORateLimiter is not None:
+            # Pace outgoing requests below Telegram's global limit instead of
+            # eating 429s and their serializing retry backoff.
+            builder = builder.rate_limiter(AIORateLimiter(overall_max_rate=30, max_retries=3))
+        self.application = builder.build()
+
         # Set up command handlers
         self._setup_handlers()
+
+    async def _run_game(self, func, *args):
+        """Run a blocking game-engine call in the thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args)
+        )
+
+    # How long a cached player status stays valid, in seconds
+    STATUS_CACHE_TTL = 2.0
+
+    async def _get_status_cached(self, user_id):
+        """Get a player's status, reusing a recent read when available."""
+        cached = self._status_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            return cached[1]
+
+        status = await self._run_game(self.game_engine.get_player_status, user_id)
+        # Entries go stale after the TTL but are only dropped on reuse or
+        # invalidation, so cap the dict the same way as _last_edit
+        if len(self._status_cache) > 512:
+            self._status_cache.clear()
+        self._status_cache[user_id] = (time.monotonic(), status)
+        return status
+
+    def _invalidate_status(self, user_id):
+        """Drop the cached status after any state-changing game call."""
+        self._status_cache.pop(user_id, None)
+
+    def _dispatch_ordered(self, chat_id, coro):
+        """Queue work for a chat, spawning its consumer task if needed."""
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            asyncio.get_running_loop().create_task(self._chat_worker(chat_id, queue))
+        queue.put_nowait(coro)
+
+    async def _chat_worker(self, chat_id, queue):
+        """Consume queued work for a single chat in FIFO order."""
+        while True:
+            try:
+                coro = await asyncio.wait_for(queue.get(), timeout=300)
+            except asyncio.TimeoutError:
+                # Chat went idle; drop the queue so it can be recreated
+                # later. An update may have raced the timeout onto this
+                # queue, so keep draining until it is really empty.
+                self._chat_queues.pop(chat_id, None)
+                while not queue.empty():
+                    coro = queue.get_nowait()
+                    try:
+                        await coro
+                    except Exception:
+                        logger.exception("Error processing queued update for chat %s", chat_id)
+                    finally:
+                        queue.task_done()
+                return
+            try:
+                await coro
+            except Exception:
+                logger.exception("Error processing queued update for chat %s", chat_id)
+            finally:
+                queue.task_done()
+
+    async def _post_init(self, application):
+        """Configure the event loop once the application has created it."""
+        # Eager tasks run handler coroutines synchronously until their first
+        # real suspension, skipping a scheduler round-trip on early returns
+        # (Python 3.12+).
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+            logger.info("Eager task factory enabled")
     
     def _setup_handlers(self):
         """Set up all command and message handlers."""
@@ -55,22 +214,21 @@ class DungeonMasterBot:
         user = update.effective_user
         
         # Start new game session
-        game_data = self.game_engine.start_new_game(
+        game_data = await self._run_game(
+            self.game_engine.start_new_game,
             user.id, user.username, user.first_name, user.last_name
         )
+        self._invalidate_status(user.id)
         
         # Create welcome message
-        welcome_text = f"🎮 *Welcome to Mini Dungeon Master!* 🎮\n\n"
+        welcome_text = "🎮 *Welcome to Mini Dungeon Master!* 🎮\n\n"
         welcome_text += f"Greetings, {user.first_name or user.username or 'Adventurer'}!\n\n"
         welcome_text += game_data['welcome_message']
         welcome_text += "\n\n*What would you like to do?*"
         
         # Create inline keyboard with choices
-        keyboard = []
-        for i, choice in enumerate(game_data['choices'], 1):
-            keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
         
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = _choices_markup(game_data['choices'])
         
         await update.message.reply_text(
             welcome_text,
@@ -81,7 +239,7 @@ class DungeonMasterBot:
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /status command."""
         user_id = update.effective_user.id
-        status = self.game_engine.get_player_status(user_id)
+        status = await self._get_status_cached(user_id)
         
         if not status:
             await update.message.reply_text("❌ You haven't started a game yet. Use /start to begin your adventure!")
@@ -89,35 +247,38 @@ class DungeonMasterBot:
         
         stats = status['stats']
         
-        # Create status message
-        status_text = f"📊 *Character Status* 📊\n\n"
-        status_text += f"❤️ **Health:** {stats['health']}/{stats['max_health']}\n"
-        status_text += f"⭐ **Level:** {stats['level']}\n"
-        status_text += f"✨ **Experience:** {stats['experience']}/{stats['level'] * config.GAME_CONFIG['experience_per_level']}\n"
-        status_text += f"💰 **Gold:** {stats['gold']}\n"
-        status_text += f"📍 **Location:** {stats['current_location']}\n"
-        status_text += f"📖 **Story Progress:** {stats['story_progress']}\n"
-        
+        # Create status message (built as parts to avoid repeated str +=)
+        parts = [
+            "📊 *Character Status* 📊\n\n"
+            f"❤️ **Health:** {stats['health']}/{stats['max_health']}\n"
+            f"⭐ **Level:** {stats['level']}\n"
+            f"✨ **Experience:** {stats['experience']}/{stats['level'] * config.GAME_CONFIG['experience_per_level']}\n"
+            f"💰 **Gold:** {stats['gold']}\n"
+            f"📍 **Location:** {stats['current_location']}\n"
+            f"📖 **Story Progress:** {stats['story_progress']}\n"
+        ]
+
         if status['in_combat']:
             combat = status['combat_info']
-            status_text += f"\n⚔️ **In Combat:** {combat['enemy_name']} ({combat['enemy_health']}/{combat['enemy_max_health']} HP)"
-        
+            parts.append(f"\n⚔️ **In Combat:** {combat['enemy_name']} ({combat['enemy_health']}/{combat['enemy_max_health']} HP)")
+
         # Show inventory summary
-        if status['inventory']:
-            status_text += f"\n\n🎒 **Inventory:** {len(status['inventory'])} items"
-            for item in status['inventory'][:3]:  # Show first 3 items
-                status_text += f"\n• {item['name']} (x{item['quantity']})"
-            if len(status['inventory']) > 3:
-                status_text += f"\n• ... and {len(status['inventory']) - 3} more items"
+        inventory = status['inventory']
+        if inventory:
+            parts.append(f"\n\n🎒 **Inventory:** {len(inventory)} items")
+            parts.extend(f"\n• {item['name']} (x{item['quantity']})" for item in inventory[:3])
+            if len(inventory) > 3:
+                parts.append(f"\n• ... and {len(inventory) - 3} more items")
         else:
-            status_text += "\n\n🎒 **Inventory:** Empty"
-        
-        await update.message.reply_text(status_text, parse_mode='Markdown')
+            parts.append("\n\n🎒 **Inventory:** Empty")
+
+        await update.message.reply_text(''.join(parts), parse_mode='Markdown')
     
     async def explore_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /explore command."""
         user_id = update.effective_user.id
-        result = self.game_engine.explore(user_id)
+        result = await self._run_game(self.game_engine.explore, user_id)
+        self._invalidate_status(user_id)
         
         if 'error' in result:
             await update.message.reply_text(f"❌ {result['error']}")
@@ -129,11 +290,8 @@ class DungeonMasterBot:
         # Add choices if available
         if 'choices' in result:
             message_text += "\n\n*What would you like to do?*"
-            keyboard = []
-            for i, choice in enumerate(result['choices'], 1):
-                keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
             
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = _choices_markup(result['choices'])
             await update.message.reply_text(message_text, parse_mode='Markdown', reply_markup=reply_markup)
         else:
             await update.message.reply_text(message_text, parse_mode='Markdown')
@@ -141,7 +299,7 @@ class DungeonMasterBot:
     async def inventory_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /inventory command."""
         user_id = update.effective_user.id
-        status = self.game_engine.get_player_status(user_id)
+        status = await self._get_status_cached(user_id)
         
         if not status:
             await update.message.reply_text("❌ You haven't started a game yet. Use /start to begin your adventure!")
@@ -153,30 +311,22 @@ class DungeonMasterBot:
             await update.message.reply_text("🎒 *Your inventory is empty.*\n\nUse /explore to find items!")
             return
         
-        # Create inventory message
-        inventory_text = f"🎒 *Inventory* 🎒\n\n"
-        
-        for item in inventory:
-            inventory_text += f"📦 **{item['name']}** (x{item['quantity']})\n"
-            inventory_text += f"   Type: {item['type'].title()}\n"
-            inventory_text += f"   Effect: {item['effect'].title()}\n"
-            inventory_text += f"   Value: {item['value']}\n"
-            inventory_text += f"   {item['description']}\n\n"
-        
-        inventory_text += f"*Total items: {len(inventory)}*"
-        
-        await update.message.reply_text(inventory_text, parse_mode='Markdown')
+        # Create inventory message (built as parts to avoid repeated str +=)
+        parts = ["🎒 *Inventory* 🎒\n\n"]
+        parts.extend(
+            f"📦 **{item['name']}** (x{item['quantity']})\n"
+            f"   Type: {item['type'].title()}\n"
+            f"   Effect: {item['effect'].title()}\n"
+            f"   Value: {item['value']}\n"
+            f"   {item['description']}\n\n"
+            for item in inventory
+        )
+        parts.append(f"*Total items: {len(inventory)}*")
+
+        await update.message.reply_text(''.join(parts), parse_mode='Markdown')
     
-    async def attack_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle the /attack command."""
-        user_id = update.effective_user.id
-        result = self.game_engine.attack_enemy(user_id)
-        
-        if 'error' in result:
-            await update.message.reply_text(f"❌ {result['error']}")
-            return
-        
-        # Create combat message
+    def _render_combat(self, result):
+        """Render a combat result into message text and an optional keyboard."""
         combat_text = f"⚔️ *Combat* ⚔️\n\n{result['message']}"
         
         if 'enemy_attack' in result:
@@ -191,45 +341,53 @@ class DungeonMasterBot:
         
         # Check for victory or defeat
         if result.get('type') == 'victory':
-            combat_text += f"\n\n🎉 **VICTORY!** 🎉\n"
+            combat_text += "\n\n🎉 **VICTORY!** 🎉\n"
             combat_text += f"Experience gained: {result['experience_gained']}"
             if result.get('level_up'):
                 combat_text += f"\n🎊 **LEVEL UP!** You are now level {result['new_level']}!"
             
-            # Add post-combat choices
             if 'choices' in result:
                 combat_text += "\n\n*What would you like to do next?*"
-                keyboard = []
-                for i, choice in enumerate(result['choices'], 1):
-                    keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await update.message.reply_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
-                return
         
         elif result.get('type') == 'defeat':
-            combat_text += f"\n\n💀 **DEFEAT** 💀\n"
+            combat_text += "\n\n💀 **DEFEAT** 💀\n"
             combat_text += f"Health restored: {result['health_restored']}"
             
-            # Add post-defeat choices
             if 'choices' in result:
                 combat_text += "\n\n*What would you like to do?*"
-                keyboard = []
-                for i, choice in enumerate(result['choices'], 1):
-                    keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await update.message.reply_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
-                return
         
-        # If combat continues, show attack options
+        # If combat continues, show the attack options
         else:
-            keyboard = [
-                [InlineKeyboardButton("⚔️ Attack", callback_data="attack")],
-                [InlineKeyboardButton("🎒 Use Item", callback_data="use_item")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            await update.message.reply_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
+            return combat_text, COMBAT_CONTINUE_MARKUP
+        
+        if 'choices' in result:
+            return combat_text, _choices_markup(result['choices'])
+        
+        return combat_text, None
+    
+    def _render_choice_result(self, result):
+        """Render a choice result into message text and an optional keyboard."""
+        choice_text = f"🎯 *Your Choice* 🎯\n\n{result['message']}"
+        
+        # Add new choices if available
+        if 'choices' in result:
+            choice_text += "\n\n*What would you like to do next?*"
+            return choice_text, _choices_markup(result['choices'])
+        
+        return choice_text, None
+    
+    async def attack_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle the /attack command."""
+        user_id = update.effective_user.id
+        result = await self._run_game(self.game_engine.attack_enemy, user_id)
+        self._invalidate_status(user_id)
+        
+        if 'error' in result:
+            await update.message.reply_text(f"❌ {result['error']}")
+            return
+        
+        combat_text, reply_markup = self._render_combat(result)
+        await update.message.reply_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
     
     async def use_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /use command."""
@@ -239,7 +397,8 @@ class DungeonMasterBot:
         
         item_name = ' '.join(context.args)
         user_id = update.effective_user.id
-        result = self.game_engine.use_item(user_id, item_name)
+        result = await self._run_game(self.game_engine.use_item, user_id, item_name)
+        self._invalidate_status(user_id)
         
         if 'error' in result:
             await update.message.reply_text(f"❌ {result['error']}")
@@ -258,198 +417,162 @@ class DungeonMasterBot:
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /help command."""
-        help_text = """
-🎮 *Mini Dungeon Master - Help* 🎮
-
-*Available Commands:*
-
-/start - Begin your adventure
-/status - Check your character stats
-/explore - Explore the world and find encounters
-/inventory - View your items
-/attack - Attack during combat
-/use <item> - Use an item from your inventory
-/help - Show this help message
-
-*How to Play:*
-• Use /start to begin your adventure
-• Use /explore to discover new areas and encounters
-• During combat, use /attack to fight enemies
-• Use /use <item_name> to use items from your inventory
-• Make choices using the numbered buttons or by typing "1", "2", etc.
-
-*Game Features:*
-• Level up by gaining experience
-• Find items and equipment
-• Battle various enemies
-• Make story choices that affect your journey
-• Persistent character progression
-
-*Tips:*
-• Keep your health high by using healing items
-• Explore regularly to find new items and encounters
-• Choose your battles wisely!
-        """
+        await update.message.reply_text(HELP_TEXT, parse_mode='Markdown')
+    
+    async def _edit_if_changed(self, query, text, parse_mode=None, reply_markup=None):
+        """Edit the callback message, skipping the call when nothing changed.
         
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        Telegram rejects edits whose payload matches the displayed message,
+        so an identical re-render (e.g. the same button pressed twice) would
+        burn an API call just to get an error back.
+        """
+        message = query.message
+        if message is not None:
+            key = (message.chat_id, message.message_id)
+            payload = (text, reply_markup)
+            # The displayed-text comparison only fires for plain sends;
+            # entity-formatted messages are caught by the recorded source
+            if self._last_edit.get(key) == payload or (
+                    message.text == text
+                    and message.reply_markup == reply_markup):
+                return
+            await query.edit_message_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
+            if len(self._last_edit) > 512:
+                self._last_edit.clear()
+            self._last_edit[key] = payload
+            return
+        await query.edit_message_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
     
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle button callbacks."""
         query = update.callback_query
         await query.answer()
-        
+
+        # Enqueue the actual work so a slow game-engine call in one chat
+        # doesn't block callbacks from other chats.
+        self._dispatch_ordered(
+            update.effective_chat.id,
+            self._process_button_callback(update, context)
+        )
+
+    async def _process_button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Process a button callback (runs on the chat's worker queue)."""
+        query = update.callback_query
         data = query.data
         user_id = update.effective_user.id
-        
-        if data.startswith("choice_"):
-            choice_number = int(data.split("_")[1])
-            result = self.game_engine.make_choice(user_id, choice_number)
-            
-            if 'error' in result:
-                await query.edit_message_text(f"❌ {result['error']}")
-                return
-            
-            # Create choice result message
-            choice_text = f"🎯 *Your Choice* 🎯\n\n{result['message']}"
-            
-            # Add new choices if available
-            if 'choices' in result:
-                choice_text += "\n\n*What would you like to do next?*"
-                keyboard = []
-                for i, choice in enumerate(result['choices'], 1):
-                    keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(choice_text, parse_mode='Markdown', reply_markup=reply_markup)
-            else:
-                await query.edit_message_text(choice_text, parse_mode='Markdown')
-        
-        elif data == "attack":
-            result = self.game_engine.attack_enemy(user_id)
-            
-            if 'error' in result:
-                await query.edit_message_text(f"❌ {result['error']}")
-                return
-            
-            # Handle combat result (similar to attack_command)
-            combat_text = f"⚔️ *Combat* ⚔️\n\n{result['message']}"
-            
-            if 'enemy_attack' in result:
-                combat_text += f"\n\n{result['enemy_attack']}"
-            
-            if 'enemy_health' in result:
-                combat_text += f"\n\n👹 **Enemy Health:** {result['enemy_health']}/{result['enemy_max_health']}"
-            
-            if 'player_health' in result:
-                combat_text += f"\n❤️ **Your Health:** {result['player_health']}"
-            
-            # Check for victory or defeat
-            if result.get('type') == 'victory':
-                combat_text += f"\n\n🎉 **VICTORY!** 🎉\n"
-                combat_text += f"Experience gained: {result['experience_gained']}"
-                if result.get('level_up'):
-                    combat_text += f"\n🎊 **LEVEL UP!** You are now level {result['new_level']}!"
-                
-                if 'choices' in result:
-                    combat_text += "\n\n*What would you like to do next?*"
-                    keyboard = []
-                    for i, choice in enumerate(result['choices'], 1):
-                        keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await query.edit_message_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
-                    return
-            
-            elif result.get('type') == 'defeat':
-                combat_text += f"\n\n💀 **DEFEAT** 💀\n"
-                combat_text += f"Health restored: {result['health_restored']}"
-                
-                if 'choices' in result:
-                    combat_text += "\n\n*What would you like to do?*"
-                    keyboard = []
-                    for i, choice in enumerate(result['choices'], 1):
-                        keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await query.edit_message_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
-                    return
-            
-            # If combat continues
-            else:
-                keyboard = [
-                    [InlineKeyboardButton("⚔️ Attack", callback_data="attack")],
-                    [InlineKeyboardButton("🎒 Use Item", callback_data="use_item")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(combat_text, parse_mode='Markdown', reply_markup=reply_markup)
-        
-        elif data == "use_item":
-            # Show inventory for item selection
-            status = self.game_engine.get_player_status(user_id)
-            if not status or not status['inventory']:
-                await query.edit_message_text("❌ You have no items to use!")
-                return
-            
-            keyboard = []
-            for item in status['inventory']:
-                keyboard.append([InlineKeyboardButton(f"Use {item['name']}", callback_data=f"use_{item['name']}")])
-            
-            keyboard.append([InlineKeyboardButton("Cancel", callback_data="cancel")])
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text("🎒 *Select an item to use:*", parse_mode='Markdown', reply_markup=reply_markup)
-        
-        elif data.startswith("use_"):
-            item_name = data[4:]  # Remove "use_" prefix
-            result = self.game_engine.use_item(user_id, item_name)
-            
-            if 'error' in result:
-                await query.edit_message_text(f"❌ {result['error']}")
+
+        # Exact matches first, then prefixed data ("choice_N" / "use_<item>")
+        handler = self._callback_handlers.get(data)
+        if handler is None:
+            kind, _, arg = data.partition("_")
+            handler = self._prefix_handlers.get(kind)
+            if handler is None:
                 return
-            
-            use_text = f"🔧 *Using Item* 🔧\n\n{result['message']}"
-            
-            if 'health_restored' in result:
-                use_text += f"\n❤️ Health restored: {result['health_restored']}"
-            
-            if 'experience_gained' in result:
-                use_text += f"\n✨ Experience gained: {result['experience_gained']}"
-            
-            await query.edit_message_text(use_text, parse_mode='Markdown')
-        
-        elif data == "cancel":
-            await query.edit_message_text("❌ Action cancelled.")
+            await handler(self, query, user_id, arg)
+            return
+        await handler(self, query, user_id)
+
+    async def _on_choice_button(self, query, user_id, arg):
+        """Handle a "choice_N" button press."""
+        result = await self._run_game(self.game_engine.make_choice, user_id, int(arg))
+        self._invalidate_status(user_id)
+
+        if 'error' in result:
+            await self._edit_if_changed(query, f"❌ {result['error']}")
+            return
+
+        choice_text, reply_markup = self._render_choice_result(result)
+        await self._edit_if_changed(query, choice_text, parse_mode='Markdown', reply_markup=reply_markup)
+
+    async def _on_attack_button(self, query, user_id):
+        """Handle the attack button press."""
+        result = await self._run_game(self.game_engine.attack_enemy, user_id)
+        self._invalidate_status(user_id)
+
+        if 'error' in result:
+            await self._edit_if_changed(query, f"❌ {result['error']}")
+            return
+
+        combat_text, reply_markup = self._render_combat(result)
+        await self._edit_if_changed(query, combat_text, parse_mode='Markdown', reply_markup=reply_markup)
+
+    async def _on_use_item_menu(self, query, user_id):
+        """Show the inventory for item selection."""
+        status = await self._get_status_cached(user_id)
+        if not status or not status['inventory']:
+            await self._edit_if_changed(query, "❌ You have no items to use!")
+            return
+
+        keyboard = [
+            [InlineKeyboardButton(f"Use {item['name']}", callback_data=f"use_{item['name']}")]
+            for item in status['inventory']
+        ]
+        keyboard.append([InlineKeyboardButton("Cancel", callback_data="cancel")])
+        reply_markup = InlineKeyboardMarkup(keyboard)
+
+        await self._edit_if_changed(query, "🎒 *Select an item to use:*", parse_mode='Markdown', reply_markup=reply_markup)
+
+    async def _on_use_button(self, query, user_id, item_name):
+        """Handle a "use_<item>" button press."""
+        result = await self._run_game(self.game_engine.use_item, user_id, item_name)
+        self._invalidate_status(user_id)
+
+        if 'error' in result:
+            await self._edit_if_changed(query, f"❌ {result['error']}")
+            return
+
+        use_text = f"🔧 *Using Item* 🔧\n\n{result['message']}"
+
+        if 'health_restored' in result:
+            use_text += f"\n❤️ Health restored: {result['health_restored']}"
+
+        if 'experience_gained' in result:
+            use_text += f"\n✨ Experience gained: {result['experience_gained']}"
+
+        await self._edit_if_changed(query, use_text, parse_mode='Markdown')
+
+    async def _on_cancel_button(self, query, user_id):
+        """Handle the cancel button press."""
+        await self._edit_if_changed(query, CANCEL_MSG)
+
+    # O(1) callback dispatch: exact callback data first, then by prefix.
+    # "use_item" must live in the exact table so it never collides with the
+    # "use_<item>" prefix.
+    _callback_handlers = {
+        "attack": _on_attack_button,
+        "use_item": _on_use_item_menu,
+        "cancel": _on_cancel_button,
+    }
+    _prefix_handlers = {
+        "choice": _on_choice_button,
+        "use": _on_use_button,
+    }
     
     async def handle_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle text messages (for choice selection)."""
+        self._dispatch_ordered(
+            update.effective_chat.id,
+            self._process_text_message(update, context)
+        )
+
+    async def _process_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Process a text message (runs on the chat's worker queue)."""
+        user_id = update.effective_user.id
         text = update.message.text.strip()
-        
+
         # Check if it's a choice number
-        if text.isdigit():
-            choice_number = int(text)
-            if 1 <= choice_number <= 4:
-                user_id = update.effective_user.id
-                result = self.game_engine.make_choice(user_id, choice_number)
-                
-                if 'error' in result:
-                    await update.message.reply_text(f"❌ {result['error']}")
-                    return
-                
-                # Create choice result message
-                choice_text = f"🎯 *Your Choice* 🎯\n\n{result['message']}"
-                
-                # Add new choices if available
-                if 'choices' in result:
-                    choice_text += "\n\n*What would you like to do next?*"
-                    keyboard = []
-                    for i, choice in enumerate(result['choices'], 1):
-                        keyboard.append([InlineKeyboardButton(f"{i}. {choice}", callback_data=f"choice_{i}")])
-                    
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    await update.message.reply_text(choice_text, parse_mode='Markdown', reply_markup=reply_markup)
-                else:
-                    await update.message.reply_text(choice_text, parse_mode='Markdown')
+        choice_number = _CHOICE_MAP.get(text)
+        if choice_number is not None:
+            result = await self._run_game(self.game_engine.make_choice, user_id, choice_number)
+            self._invalidate_status(user_id)
+
+            if 'error' in result:
+                await update.message.reply_text(f"❌ {result['error']}")
                 return
+
+            choice_text, reply_markup = self._render_choice_result(result)
+            await update.message.reply_text(choice_text, parse_mode='Markdown', reply_markup=reply_markup)
+            return
         
         # If not a choice number, provide help
         await update.message.reply_text(
@@ -459,12 +582,34 @@ class DungeonMasterBot:
     
     def run(self):
         """Start the bot."""
+        if uvloop is not None:
+            # Use the libuv-based event loop for faster I/O scheduling.
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+
         logger.info("Starting Mini Dungeon Master Bot...")
-        self.application.run_polling()
+        if config.PUBLIC_URL:
+            # Webhook mode: Telegram pushes updates to us instead of the bot
+            # polling getUpdates, cutting idle overhead and update latency.
+            self.application.run_webhook(
+                listen="0.0.0.0",
+                port=config.WEBHOOK_PORT,
+                url_path=config.WEBHOOK_SECRET,
+                webhook_url=f"{config.PUBLIC_URL}/{config.WEBHOOK_SECRET}",
+                secret_token=config.WEBHOOK_SECRET or None
+            )
+        else:
+            self.application.run_polling()
 
 
 def main():
     """Main function to run the bot."""
+    # Configure logging here rather than at import time so importing this
+    # module stays side-effect free for other entry points.
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=logging.INFO
+    )
     bot = DungeonMasterBot()
     bot.run()
 
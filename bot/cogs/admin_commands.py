@@ -6,7 +6,9 @@ and management functions.
 """
 
 import asyncio
+import functools
 import logging
+import time
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -17,32 +19,8 @@ from discord import app_commands
 from ..core.logger import get_logger
 
 
-class AdminCommands(commands.Cog):
-    """Cog containing administrative commands."""
-    
-    def __init__(self, bot):
-        """Initialize the admin commands cog."""
-        self.bot = bot
-        self.logger = get_logger(__name__)
-    
-    def is_admin(ctx):
-        """Check if user has admin permissions."""
-        return ctx.author.guild_permissions.administrator or ctx.author.id in [
-            # Add admin user IDs here
-        ]
-    
-    @commands.command(name='help')
-    async def help_command(self, ctx):
-        """Show help information."""
-        try:
-            embed = discord.Embed(
-                title="🎮 Mini Dungeon Master - Help",
-                description="Welcome to the Mini Dungeon Master RPG bot!",
-                color=self.bot.config.get_color('info')
-            )
-            
-            # Game commands
-            game_commands = """
+# Static help text, built once at import time
+_GAME_COMMANDS = """
 **🎮 Game Commands:**
 `!start` - Begin your adventure
 `!status` - Check your character stats
@@ -51,31 +29,16 @@ class AdminCommands(commands.Cog):
 `!attack` - Attack during combat
 `!use <item>` - Use an item from your inventory
             """
-            
-            embed.add_field(
-                name="Game Commands",
-                value=game_commands,
-                inline=False
-            )
-            
-            # Admin commands (if user is admin)
-            if self.is_admin(ctx):
-                admin_commands = """
+
+_ADMIN_COMMANDS = """
 **⚙️ Admin Commands:**
 `!stats` - View bot statistics
 `!ping` - Check bot latency
 `!cleanup` - Clean up caches and rate limits
 `!restart` - Restart the bot (owner only)
                 """
-                
-                embed.add_field(
-                    name="Admin Commands",
-                    value=admin_commands,
-                    inline=False
-                )
-            
-            # Game features
-            features = """
+
+_FEATURES = """
 **🎯 Game Features:**
 • Level up by gaining experience
 • Find items and equipment
@@ -88,36 +51,166 @@ class AdminCommands(commands.Cog):
 • Explore regularly to find new items and encounters
 • Choose your battles wisely!
             """
-            
-            embed.add_field(
-                name="Features & Tips",
-                value=features,
-                inline=False
+
+
+# Key permissions surfaced by userinfo, as (label, permission bit) pairs.
+# Testing bits against Permissions.value avoids one flag-property lookup
+# per permission.
+_KEY_PERMS = [
+    ('Administrator', discord.Permissions.administrator.flag),
+    ('Manage Server', discord.Permissions.manage_guild.flag),
+    ('Manage Messages', discord.Permissions.manage_messages.flag),
+    ('Manage Roles', discord.Permissions.manage_roles.flag),
+]
+
+@functools.lru_cache(maxsize=512)
+def _format_dates(created_at, joined_at):
+    """Format the account-info field value, memoized per (created, joined).
+    
+    Datetimes are immutable, so repeated lookups of the same user reuse
+    the formatted string instead of rebuilding it.
+    """
+    created = f"{created_at.replace(microsecond=0).isoformat(sep=' ')} UTC"
+    joined = f"{joined_at.replace(microsecond=0).isoformat(sep=' ')} UTC" if joined_at else "Unknown"
+    return f"Created: {created}\nJoined: {joined}"
+
+
+# Suppresses mention parsing on replies that embed role/owner mentions,
+# so they render without pinging anyone
+_NO_MENTIONS = discord.AllowedMentions.none()
+
+# Extra user IDs allowed to run admin commands, checked with O(1) set
+# membership instead of rebuilding a list on every invocation
+_ADMIN_IDS = frozenset([
+    # Add admin user IDs here
+])
+
+
+def is_admin(ctx):
+    """Check if user has admin permissions."""
+    return ctx.author.guild_permissions.administrator or ctx.author.id in _ADMIN_IDS
+
+
+class AdminCommands(commands.Cog):
+    """Cog containing administrative commands."""
+    
+    def __init__(self, bot):
+        """Initialize the admin commands cog."""
+        self.bot = bot
+        self.logger = get_logger(__name__)
+        # Embed colors are fixed at startup; resolve them once instead of
+        # going through bot.config on every embed build.
+        self._color_info = bot.config.get_color('info')
+        self._color_success = bot.config.get_color('success')
+        self._color_warning = bot.config.get_color('warning')
+        self._color_error = bot.config.get_color('error')
+        # Help embeds are identical between invocations, so build them once
+        # (lazily, per admin/non-admin variant) instead of per command call.
+        self._help_embeds = {}
+        # get_stats() walks every guild and member; keep the result around
+        # for a few seconds so repeated !stats calls don't re-scan.
+        self._stats_cache = None
+        # Channel/role counts per guild change rarely; cache them briefly
+        # so back-to-back serverinfo calls skip the channel list walks.
+        self._guild_info_cache = {}
+        # Result of the last !cleanup run, reused while the debounce holds
+        self._last_cleanup = None
+        # Pending delayed-shutdown timer scheduled by !restart, if any
+        self._restart_handle = None
+        # All error replies share one embed shape; copy a prebuilt template
+        # instead of constructing a fresh embed on every failure.
+        self._error_embed_template = discord.Embed(
+            title="❌ Error",
+            color=self._color_error
+        )
+
+    def _get_help_embed(self, include_admin):
+        """Get the cached help embed, building it on first use."""
+        embed = self._help_embeds.get(include_admin)
+        if embed is None:
+            embed = discord.Embed(
+                title="🎮 Mini Dungeon Master - Help",
+                description="Welcome to the Mini Dungeon Master RPG bot!",
+                color=self._color_info
             )
-            
+            embed.add_field(name="Game Commands", value=_GAME_COMMANDS, inline=False)
+            if include_admin:
+                embed.add_field(name="Admin Commands", value=_ADMIN_COMMANDS, inline=False)
+            embed.add_field(name="Features & Tips", value=_FEATURES, inline=False)
             embed.set_footer(text=f"Use {self.bot.config.command_prefix}help to see this message again")
-            
+            self._help_embeds[include_admin] = embed
+        return embed
+
+    # How long cached per-guild channel/role counts stay valid, in seconds
+    GUILD_INFO_CACHE_TTL = 10.0
+
+    def _get_guild_counts(self, guild):
+        """Get (text, voice, category, role) counts for a guild, cached briefly."""
+        cached = self._guild_info_cache.get(guild.id)
+        if cached is not None and time.monotonic() - cached[0] < self.GUILD_INFO_CACHE_TTL:
+            return cached[1]
+
+        counts = (
+            len(guild.text_channels),
+            len(guild.voice_channels),
+            len(guild.categories),
+            len(guild.roles),
+        )
+        self._guild_info_cache[guild.id] = (time.monotonic(), counts)
+        return counts
+
+    # Minimum seconds between full cleanup passes; repeat calls inside
+    # this window reuse the previous result instead of re-scanning.
+    CLEANUP_DEBOUNCE = 30.0
+
+    async def _send_error(self, ctx, description):
+        """Send a standard error embed with the given description."""
+        embed = self._error_embed_template.copy()
+        embed.description = description
+        await ctx.send(embed=embed)
+
+    def cog_unload(self):
+        """Cancel any pending restart timer when the cog is unloaded."""
+        if self._restart_handle is not None:
+            self._restart_handle.cancel()
+            self._restart_handle = None
+
+    # How long a computed stats dict stays valid, in seconds
+    STATS_CACHE_TTL = 5.0
+
+    def _get_stats_cached(self):
+        """Get bot statistics, reusing a recent computation when available."""
+        cached = self._stats_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STATS_CACHE_TTL:
+            return cached[1]
+
+        stats = self.bot.get_stats()
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
+
+    @commands.command(name='help')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
+    async def help_command(self, ctx):
+        """Show help information."""
+        try:
+            embed = self._get_help_embed(is_admin(ctx))
             await ctx.send(embed=embed)
-            
+
         except Exception as e:
             self.logger.error(f"Error in help command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to show help. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to show help. Please try again.")
     
     @commands.command(name='stats')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     @commands.check(is_admin)
     async def stats_command(self, ctx):
         """Show bot statistics (admin only)."""
         try:
-            stats = self.bot.get_stats()
+            stats = self._get_stats_cached()
             
             embed = discord.Embed(
                 title="📊 Bot Statistics",
-                color=self.bot.config.get_color('info')
+                color=self._color_info
             )
             
             # Basic stats
@@ -184,14 +277,10 @@ class AdminCommands(commands.Cog):
             
         except Exception as e:
             self.logger.error(f"Error in stats command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get statistics. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to get statistics. Please try again.")
     
     @commands.command(name='ping')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     @commands.check(is_admin)
     async def ping_command(self, ctx):
         """Check bot latency (admin only)."""
@@ -201,13 +290,13 @@ class AdminCommands(commands.Cog):
             # Determine status based on latency
             if latency < 100:
                 status = "🟢 Excellent"
-                color = self.bot.config.get_color('success')
+                color = self._color_success
             elif latency < 200:
                 status = "🟡 Good"
-                color = self.bot.config.get_color('warning')
+                color = self._color_warning
             else:
                 status = "🔴 Poor"
-                color = self.bot.config.get_color('error')
+                color = self._color_error
             
             embed = discord.Embed(
                 title="🏓 Pong!",
@@ -219,22 +308,32 @@ class AdminCommands(commands.Cog):
             
         except Exception as e:
             self.logger.error(f"Error in ping command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to check latency. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to check latency. Please try again.")
     
     @commands.command(name='cleanup')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     @commands.check(is_admin)
     async def cleanup_command(self, ctx):
         """Clean up caches and rate limits (admin only)."""
         try:
-            # Perform cleanup
-            cache_stats = self.bot.cache_manager.cleanup_all()
-            command_cleanup = self.bot.command_rate_limiter.cleanup()
-            api_cleanup = self.bot.api_rate_limiter.cleanup()
+            cached = self._last_cleanup
+            if cached is not None and time.monotonic() - cached[0] < self.CLEANUP_DEBOUNCE:
+                # A pass just ran; report its numbers instead of re-scanning
+                cache_stats, command_cleanup, api_cleanup = cached[1]
+                suffix = " (cached)"
+            else:
+                # The scans walk every cache and rate-limit bucket; run them
+                # in threads so the event loop keeps serving other commands.
+                cache_stats, command_cleanup, api_cleanup = await asyncio.gather(
+                    asyncio.to_thread(self.bot.cache_manager.cleanup_all),
+                    asyncio.to_thread(self.bot.command_rate_limiter.cleanup),
+                    asyncio.to_thread(self.bot.api_rate_limiter.cleanup),
+                )
+                self._last_cleanup = (
+                    time.monotonic(),
+                    (cache_stats, command_cleanup, api_cleanup),
+                )
+                suffix = ""
             
             total_cleaned = (
                 sum(cache_stats.values()) + 
@@ -244,8 +343,8 @@ class AdminCommands(commands.Cog):
             
             embed = discord.Embed(
                 title="🧹 Cleanup Complete",
-                description=f"Cleaned up **{total_cleaned}** expired entries",
-                color=self.bot.config.get_color('success')
+                description=f"Cleaned up **{total_cleaned}** expired entries{suffix}",
+                color=self._color_success
             )
             
             # Add detailed stats
@@ -278,14 +377,10 @@ class AdminCommands(commands.Cog):
             
         except Exception as e:
             self.logger.error(f"Error in cleanup command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to perform cleanup. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to perform cleanup. Please try again.")
     
     @commands.command(name='restart')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     async def restart_command(self, ctx):
         """Restart the bot (owner only)."""
         try:
@@ -294,7 +389,7 @@ class AdminCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ Permission Denied",
                     description="Only the bot owner can restart the bot.",
-                    color=self.bot.config.get_color('error')
+                    color=self._color_error
                 )
                 await ctx.send(embed=embed)
                 return
@@ -302,33 +397,29 @@ class AdminCommands(commands.Cog):
             embed = discord.Embed(
                 title="🔄 Restarting Bot",
                 description="The bot will restart in 5 seconds...",
-                color=self.bot.config.get_color('warning')
+                color=self._color_warning
             )
             await ctx.send(embed=embed)
             
-            # Wait 5 seconds then restart
-            await asyncio.sleep(5)
-            
-            # Restart the bot
-            await self.bot.close()
+            # Schedule the shutdown instead of sleeping inline, so the
+            # command returns immediately and the cog stays unloadable
+            self._restart_handle = self.bot.loop.call_later(
+                5.0, lambda: self.bot.loop.create_task(self.bot.close())
+            )
             
         except Exception as e:
             self.logger.error(f"Error in restart command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to restart bot. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to restart bot. Please try again.")
     
     @commands.command(name='debug')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     @commands.check(is_admin)
     async def debug_command(self, ctx):
         """Show debug information (admin only)."""
         try:
             embed = discord.Embed(
                 title="🐛 Debug Information",
-                color=self.bot.config.get_color('info')
+                color=self._color_info
             )
             
             # Bot info
@@ -376,14 +467,10 @@ Log Level: {self.bot.config.log_level}
             
         except Exception as e:
             self.logger.error(f"Error in debug command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get debug information. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to get debug information. Please try again.")
     
     @commands.command(name='userinfo')
+    @commands.cooldown(1, 2.0, commands.BucketType.user)
     @commands.check(is_admin)
     async def userinfo_command(self, ctx, user: Optional[discord.Member] = None):
         """Get information about a user (admin only)."""
@@ -393,7 +480,7 @@ Log Level: {self.bot.config.log_level}
             
             embed = discord.Embed(
                 title=f"👤 User Information",
-                color=self.bot.config.get_color('info')
+                color=self._color_info
             )
             
             embed.set_thumbnail(url=user.display_avatar.url)
@@ -406,18 +493,25 @@ Log Level: {self.bot.config.log_level}
             )
             
             # Account info
-            created_at = user.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
-            joined_at = user.joined_at.strftime("%Y-%m-%d %H:%M:%S UTC") if user.joined_at else "Unknown"
-            
             embed.add_field(
                 name="📅 Account Info",
-                value=f"Created: {created_at}\nJoined: {joined_at}",
+                value=_format_dates(user.created_at, user.joined_at),
                 inline=False
             )
             
-            # Roles
-            roles = [role.mention for role in user.roles[1:]]  # Skip @everyone
-            roles_text = ", ".join(roles) if roles else "No roles"
+            # Roles. Embed field values cap at 1024 chars, so stop
+            # accumulating mentions once the field is effectively full
+            # instead of materializing every role first.
+            role_parts = []
+            total = 0
+            for role in user.roles[1:]:  # Skip @everyone
+                mention = role.mention
+                if total + len(mention) + 2 > 1000:
+                    role_parts.append("…")
+                    break
+                role_parts.append(mention)
+                total += len(mention) + 2
+            roles_text = ", ".join(role_parts) if role_parts else "No roles"
             
             embed.add_field(
                 name="🎭 Roles",
@@ -425,16 +519,9 @@ Log Level: {self.bot.config.log_level}
                 inline=False
             )
             
-            # Permissions
-            permissions = []
-            if user.guild_permissions.administrator:
-                permissions.append("Administrator")
-            if user.guild_permissions.manage_guild:
-                permissions.append("Manage Server")
-            if user.guild_permissions.manage_messages:
-                permissions.append("Manage Messages")
-            if user.guild_permissions.manage_roles:
-                permissions.append("Manage Roles")
+            # Permissions (single bitmask read instead of one lookup per flag)
+            perms_value = user.guild_permissions.value
+            permissions = [name for name, bit in _KEY_PERMS if perms_value & bit]
             
             perms_text = ", ".join(permissions) if permissions else "No special permissions"
             
@@ -444,18 +531,14 @@ Log Level: {self.bot.config.log_level}
                 inline=False
             )
             
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             self.logger.error(f"Error in userinfo command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get user information. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to get user information. Please try again.")
     
     @commands.command(name='serverinfo')
+    @commands.cooldown(1, 2.0, commands.BucketType.channel)
     @commands.check(is_admin)
     async def serverinfo_command(self, ctx):
         """Get information about the server (admin only)."""
@@ -464,7 +547,7 @@ Log Level: {self.bot.config.log_level}
             
             embed = discord.Embed(
                 title=f"🏠 Server Information",
-                color=self.bot.config.get_color('info')
+                color=self._color_info
             )
             
             if guild.icon:
@@ -477,17 +560,17 @@ Log Level: {self.bot.config.log_level}
                 inline=False
             )
             
-            # Member info
+            # Member info (single pass over the member list)
+            bots = sum(1 for m in guild.members if m.bot)
+            humans = guild.member_count - bots
             embed.add_field(
                 name="👥 Members",
-                value=f"Total: {guild.member_count}\nHumans: {len([m for m in guild.members if not m.bot])}\nBots: {len([m for m in guild.members if m.bot])}",
+                value=f"Total: {guild.member_count}\nHumans: {humans}\nBots: {bots}",
                 inline=True
             )
             
-            # Channel info
-            text_channels = len(guild.text_channels)
-            voice_channels = len(guild.voice_channels)
-            categories = len(guild.categories)
+            # Channel and role info
+            text_channels, voice_channels, categories, roles = self._get_guild_counts(guild)
             
             embed.add_field(
                 name="📺 Channels",
@@ -495,15 +578,14 @@ Log Level: {self.bot.config.log_level}
                 inline=True
             )
             
-            # Role info
             embed.add_field(
                 name="🎭 Roles",
-                value=f"Total: {len(guild.roles)}",
+                value=f"Total: {roles}",
                 inline=True
             )
             
             # Server info
-            created_at = guild.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+            created_at = f"{guild.created_at.replace(microsecond=0).isoformat(sep=' ')} UTC"
             embed.add_field(
                 name="📅 Server Info",
                 value=f"Created: {created_at}\nBoost Level: {guild.premium_tier}\nBoosts: {guild.premium_subscription_count}",
@@ -520,16 +602,11 @@ Log Level: {self.bot.config.log_level}
                     inline=False
                 )
             
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             self.logger.error(f"Error in serverinfo command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get server information. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            await self._send_error(ctx, "Failed to get server information. Please try again.")
 
 
 async def setup(bot):
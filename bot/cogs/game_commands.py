@@ -6,16 +6,146 @@ rate limiting, and caching for optimal performance.
 """
 
 import asyncio
-import logging
+import functools
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime
+from dataclasses import dataclass
 
 import discord
 from discord.ext import commands
-from discord import app_commands
 
 from ..core.logger import get_logger
-from ..utils.rate_limiter import RateLimitError
+
+
+# Embed colors used across the cog and its views, resolved from config
+# once on first use instead of per embed build
+_COLORS: Dict[str, int] = {}
+
+_COLOR_KEYS = ('error', 'warning', 'info', 'success', 'status',
+               'inventory', 'combat', 'victory', 'defeat')
+
+
+def _get_colors(config):
+    """Get the shared color table, populating it lazily from config."""
+    if not _COLORS:
+        _COLORS.update({key: config.get_color(key) for key in _COLOR_KEYS})
+    return _COLORS
+
+
+@dataclass(slots=True)
+class _PlayerStatus:
+    """Slotted view over the engine's status dict.
+    
+    The embed builders read these fields repeatedly; attribute access on
+    a slotted instance is cheaper than string-key dict lookups.
+    """
+    health: int
+    max_health: int
+    level: int
+    experience: int
+    gold: int
+    current_location: str
+    story_progress: int
+    inventory: list
+    inventory_count: int
+    in_combat: bool
+    combat_info: Optional[Dict[str, Any]]
+    
+    @classmethod
+    def from_engine(cls, status):
+        """Build from the raw dict returned by the game engine."""
+        stats = status['stats']
+        return cls(
+            health=stats['health'],
+            max_health=stats['max_health'],
+            level=stats['level'],
+            experience=stats['experience'],
+            gold=stats['gold'],
+            current_location=stats['current_location'],
+            story_progress=stats['story_progress'],
+            inventory=status['inventory'],
+            inventory_count=status.get('inventory_count', len(status['inventory'])),
+            in_combat=status['in_combat'],
+            combat_info=status['combat_info'],
+        )
+
+
+# Constant reply embeds, built once on first use. These never change
+# between sends, so every send reuses the same object instead of
+# rebuilding (and re-serializing from scratch) each time.
+_STATIC_EMBEDS: Dict[str, discord.Embed] = {}
+
+
+def _static_embed(key, title, description, color_key):
+    """Get a constant embed, building and caching it on first use."""
+    embed = _STATIC_EMBEDS.get(key)
+    if embed is None:
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=_COLORS[color_key]
+        )
+        _STATIC_EMBEDS[key] = embed
+    return embed
+
+
+def _set_fields(embed, fields):
+    """Attach a prebuilt field list to an embed in one assignment.
+    
+    Bypasses one EmbedProxy allocation per add_field call; falls back to
+    add_field if a future discord.py drops the private attribute.
+    """
+    try:
+        embed._fields = fields
+    except AttributeError:
+        for field in fields:
+            embed.add_field(**field)
+    return embed
+
+
+def _safe_command(label, user_msg):
+    """Wrap a command with the standard log-and-report error path."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, ctx, *args, **kwargs):
+            try:
+                return await fn(self, ctx, *args, **kwargs)
+            except Exception as e:
+                self.logger.error(f"Error in {label}: {e}", exc_info=True)
+                await _send_error(ctx, "❌ Error", user_msg)
+        return wrapper
+    return decorator
+
+
+def _safe_callback(label, user_msg):
+    """Interaction-aware variant of _safe_command for view callbacks."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, interaction, *args, **kwargs):
+            try:
+                return await fn(self, interaction, *args, **kwargs)
+            except Exception as e:
+                self.bot.logger.error(f"Error in {label}: {e}", exc_info=True)
+                await _send_error(interaction, "❌ Error", user_msg)
+        return wrapper
+    return decorator
+
+
+# Template for failure replies; callers clone it rather than allocating
+# and configuring a fresh embed on every error path
+_ERROR_TEMPLATE = discord.Embed(title="❌ Error")
+
+
+async def _send_error(target, title, description):
+    """Send a standard error embed to a context or interaction."""
+    embed = _ERROR_TEMPLATE.copy()
+    embed.title = title
+    embed.description = description
+    embed.color = _COLORS['error']
+    if isinstance(target, discord.Interaction):
+        await target.response.edit_message(embed=embed, view=None)
+    else:
+        await target.send(embed=embed)
 
 
 class GameCommands(commands.Cog):
@@ -25,6 +155,19 @@ class GameCommands(commands.Cog):
         """Initialize the game commands cog."""
         self.bot = bot
         self.logger = get_logger(__name__)
+        self._colors = _get_colors(bot.config)
+        self._xp_per_level = bot.config.game_config['experience_per_level']
+        # Template for cooldown denials; only the retry time changes
+        self._cooldown_template = discord.Embed(
+            title="⏰ Command on Cooldown",
+            color=self._colors['warning']
+        )
+        # Per-user (count, window_start) for suppressing denial replies
+        # when a user hammers commands while on cooldown
+        self._denials = {}
+        # Live denial-reply tasks; unreferenced tasks can be collected
+        # mid-flight and their exceptions go unretrieved
+        self._notify_tasks = set()
         
         # Check if game components are available
         if not hasattr(bot, 'game_engine') or bot.game_engine is None:
@@ -35,445 +178,360 @@ class GameCommands(commands.Cog):
             self.game_engine = bot.game_engine
             self.db_manager = bot.db_manager
     
-    async def cog_before_invoke(self, ctx):
-        """Check rate limits and game availability before command execution."""
+    # Denial replies per user allowed within each one-second window
+    MAX_DENIALS_PER_SEC = 3
+
+    def _notify_denial(self, coro):
+        """Send a denial reply without awaiting it, keeping the task alive."""
+        task = asyncio.create_task(coro)
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._on_notify_done)
+
+    def _on_notify_done(self, task):
+        """Release a finished denial task and surface its failure, if any."""
+        self._notify_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Denial reply failed: %s", task.exception())
+
+    def _should_notify_denial(self, user_id):
+        """Decide whether a denied command still gets a reply.
+        
+        Spamming users stop receiving denial embeds entirely, so being
+        rate limited cannot itself generate API traffic.
+        """
+        now = time.monotonic()
+        count, window_start = self._denials.get(user_id, (0, now))
+        if now - window_start >= 1.0:
+            count, window_start = 0, now
+        # Windows are never swept individually, so cap the dict instead
+        if len(self._denials) > 1024:
+            self._denials.clear()
+        self._denials[user_id] = (count + 1, window_start)
+        return count < self.MAX_DENIALS_PER_SEC
+
+    async def cog_check(self, ctx):
+        """Check rate limits and game availability before command execution.
+        
+        A check rather than cog_before_invoke: discord.py ignores the
+        hook's return value, so a denial there never actually stopped
+        the command from running.
+        """
         if not self.game_available:
-            embed = discord.Embed(
-                title="❌ Game Unavailable",
-                description="The game system is currently unavailable. Please try again later.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            # Fire and forget: don't tie the denial to the REST round-trip
+            self._notify_denial(_send_error(
+                ctx, "❌ Game Unavailable",
+                "The game system is currently unavailable. Please try again later."
+            ))
             return False
         
         # Check rate limit
         command_name = ctx.command.name
         user_id = ctx.author.id
         
-        can_execute, retry_after = self.bot.command_rate_limiter.check_command(
+        can_execute, retry_after = self.bot.command_rate_limiter.try_acquire(
             user_id, command_name
         )
         
         if not can_execute:
-            embed = discord.Embed(
-                title="⏰ Command on Cooldown",
-                description=f"Please wait {retry_after:.1f} seconds before using this command again.",
-                color=self.bot.config.get_color('warning')
-            )
-            await ctx.send(embed=embed)
+            if self._should_notify_denial(user_id):
+                embed = self._cooldown_template.copy()
+                embed.description = f"Please wait {retry_after:.1f} seconds before using this command again."
+                self._notify_denial(ctx.send(embed=embed))
             return False
         
-        # Set cooldown
-        self.bot.command_rate_limiter.set_command_cooldown(user_id, command_name)
         return True
     
+    async def _get_cached_status(self, user_id, ttl=30):
+        """Get a player's status, going through the game-state cache.
+        
+        Every command reads status through here so the cache is hit on
+        the hot paths instead of only in status/inventory.
+        """
+        cache_key = f"status_{user_id}"
+        status = self.bot.cache_manager.get_game_state(cache_key)
+        if status is None:
+            raw = await asyncio.to_thread(self.game_engine.get_player_status, user_id)
+            if raw:
+                status = _PlayerStatus.from_engine(raw)
+                self.bot.cache_manager.set_game_state(cache_key, status, ttl=ttl)
+        return status, cache_key
+    
     @commands.command(name='start')
+    @_safe_command("start command", "Failed to start game. Please try again.")
     async def start_command(self, ctx):
         """Start a new game session."""
-        try:
-            user = ctx.author
-            
-            # Check cache first
-            cache_key = f"game_start_{user.id}"
-            cached_result = self.bot.cache_manager.get_command_result(cache_key)
-            
-            if cached_result:
-                embed = discord.Embed(
-                    title="🎮 Welcome Back!",
-                    description="You already have an active game session.",
-                    color=self.bot.config.get_color('info')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Start new game session
-            game_data = self.game_engine.start_new_game(
+        user = ctx.author
+        
+        # One fused cache read/compute/store instead of a get, a
+        # branch and a separate set
+        game_data, was_cached = await self.bot.cache_manager.get_or_compute(
+            f"game_start_{user.id}",
+            lambda: asyncio.to_thread(
+                self.game_engine.start_new_game,
                 user.id, user.name, user.display_name, None
-            )
-            
-            # Cache the result
-            self.bot.cache_manager.set_command_result(cache_key, game_data, ttl=60)
-            
-            # Create welcome embed
-            embed = discord.Embed(
-                title="🎮 Welcome to Mini Dungeon Master! 🎮",
-                description=f"Greetings, {user.display_name or user.name or 'Adventurer'}!",
-                color=self.bot.config.get_color('success')
-            )
-            
-            embed.add_field(
-                name="Story",
-                value=game_data['welcome_message'],
-                inline=False
-            )
-            
-            # Create choice buttons
-            view = ChoiceView(self.bot, game_data['choices'])
-            
-            await ctx.send(embed=embed, view=view)
-            
-        except Exception as e:
-            self.logger.error(f"Error in start command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to start game. Please try again.",
-                color=self.bot.config.get_color('error')
+            ),
+            ttl=60
+        )
+        
+        if was_cached:
+            embed = _static_embed(
+                'welcome_back', "🎮 Welcome Back!",
+                "You already have an active game session.", 'info'
             )
             await ctx.send(embed=embed)
+            return
+        
+        # Create welcome embed
+        embed = discord.Embed(
+            title="🎮 Welcome to Mini Dungeon Master! 🎮",
+            description=f"Greetings, {user.display_name or user.name or 'Adventurer'}!",
+            color=self._colors['success']
+        )
+        
+        embed.add_field(
+            name="Story",
+            value=game_data['welcome_message'],
+            inline=False
+        )
+        
+        # Create choice buttons
+        view = ChoiceView(self.bot, game_data['choices'])
+        
+        await ctx.send(embed=embed, view=view)
     
     @commands.command(name='status')
+    @_safe_command("status command", "Failed to get status. Please try again.")
     async def status_command(self, ctx):
         """Check your character status."""
-        try:
-            user_id = ctx.author.id
-            
-            # Check cache first
-            cache_key = f"status_{user_id}"
-            cached_status = self.bot.cache_manager.get_game_state(cache_key)
-            
-            if cached_status:
-                status = cached_status
-            else:
-                status = self.game_engine.get_player_status(user_id)
-                # Cache for 30 seconds
-                self.bot.cache_manager.set_game_state(cache_key, status, ttl=30)
-            
-            if not status:
-                embed = discord.Embed(
-                    title="❌ No Active Game",
-                    description="You haven't started a game yet. Use `!start` to begin your adventure!",
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Create status embed
-            embed = await self._create_status_embed(ctx.author, status)
-            await ctx.send(embed=embed)
-            
-        except Exception as e:
-            self.logger.error(f"Error in status command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get status. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+        user_id = ctx.author.id
+        
+        status, _ = await self._get_cached_status(user_id)
+        
+        if not status:
+            await _send_error(ctx, "❌ No Active Game", "You haven't started a game yet. Use `!start` to begin your adventure!")
+            return
+        
+        # Create status embed
+        embed = await self._create_status_embed(ctx.author, status)
+        await ctx.send(embed=embed)
     
     @commands.command(name='explore')
+    @_safe_command("explore command", "Failed to explore. Please try again.")
     async def explore_command(self, ctx):
         """Explore the world and find encounters."""
-        try:
-            user_id = ctx.author.id
-            
-            # Check if user has active game
-            status = self.game_engine.get_player_status(user_id)
-            if not status:
-                embed = discord.Embed(
-                    title="❌ No Active Game",
-                    description="You haven't started a game yet. Use `!start` to begin your adventure!",
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Explore
-            result = self.game_engine.explore(user_id)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Exploration Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Create exploration embed
-            embed = discord.Embed(
-                title="🗺️ Exploration Results",
-                description=result['message'],
-                color=self.bot.config.get_color('info')
-            )
-            
-            # Add choices if available
-            if 'choices' in result:
-                view = ChoiceView(self.bot, result['choices'])
-                await ctx.send(embed=embed, view=view)
-            else:
-                await ctx.send(embed=embed)
-            
-            # Invalidate status cache
-            self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
-            
-        except Exception as e:
-            self.logger.error(f"Error in explore command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to explore. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
+        user_id = ctx.author.id
+        
+        # Check if user has active game
+        status, cache_key = await self._get_cached_status(user_id)
+        if not status:
+            await _send_error(ctx, "❌ No Active Game", "You haven't started a game yet. Use `!start` to begin your adventure!")
+            return
+        
+        # Explore
+        result = await asyncio.to_thread(self.game_engine.explore, user_id)
+        
+        if 'error' in result:
+            await _send_error(ctx, "❌ Exploration Error", result['error'])
+            return
+        
+        # Create exploration embed
+        embed = discord.Embed(
+            title="🗺️ Exploration Results",
+            description=result['message'],
+            color=self._colors['info']
+        )
+        
+        # Invalidate before the send so the next command's cache miss
+        # is already primed while the HTTP round-trip completes
+        self.bot.cache_manager.invalidate_many((cache_key,))
+        
+        # Add choices if available
+        if 'choices' in result:
+            view = ChoiceView(self.bot, result['choices'])
+            await ctx.send(embed=embed, view=view)
+        else:
             await ctx.send(embed=embed)
     
     @commands.command(name='inventory')
+    @_safe_command("inventory command", "Failed to get inventory. Please try again.")
     async def inventory_command(self, ctx):
         """View your inventory."""
-        try:
-            user_id = ctx.author.id
-            
-            # Get status (with caching)
-            cache_key = f"status_{user_id}"
-            cached_status = self.bot.cache_manager.get_game_state(cache_key)
-            
-            if cached_status:
-                status = cached_status
-            else:
-                status = self.game_engine.get_player_status(user_id)
-                self.bot.cache_manager.set_game_state(cache_key, status, ttl=30)
-            
-            if not status:
-                embed = discord.Embed(
-                    title="❌ No Active Game",
-                    description="You haven't started a game yet. Use `!start` to begin your adventure!",
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            inventory = status['inventory']
-            
-            if not inventory:
-                embed = discord.Embed(
-                    title="🎒 Inventory",
-                    description="Your inventory is empty.\n\nUse `!explore` to find items!",
-                    color=self.bot.config.get_color('inventory')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Create inventory embed
-            embed = await self._create_inventory_embed(inventory)
-            await ctx.send(embed=embed)
-            
-        except Exception as e:
-            self.logger.error(f"Error in inventory command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to get inventory. Please try again.",
-                color=self.bot.config.get_color('error')
+        user_id = ctx.author.id
+        
+        status, _ = await self._get_cached_status(user_id)
+        
+        if not status:
+            await _send_error(ctx, "❌ No Active Game", "You haven't started a game yet. Use `!start` to begin your adventure!")
+            return
+        
+        inventory = status.inventory
+        
+        if not inventory:
+            embed = _static_embed(
+                'inventory_empty', "🎒 Inventory",
+                "Your inventory is empty.\n\nUse `!explore` to find items!",
+                'inventory'
             )
             await ctx.send(embed=embed)
+            return
+        
+        # Reuse the rendered embed while the inventory is unchanged;
+        # the hash key ties the cached render to the exact contents
+        inv_hash = hash(tuple((i['name'], i['quantity']) for i in inventory))
+        render_key = f"inv_embed_{user_id}_{inv_hash}"
+        cached_embed = self.bot.cache_manager.get_command_result(render_key)
+        
+        if cached_embed is not None:
+            embed = discord.Embed.from_dict(cached_embed)
+        else:
+            embed = await self._create_inventory_embed(inventory)
+            self.bot.cache_manager.set_command_result(render_key, embed.to_dict(), ttl=30)
+        
+        await ctx.send(embed=embed)
     
     @commands.command(name='attack')
+    @_safe_command("attack command", "Failed to attack. Please try again.")
     async def attack_command(self, ctx):
         """Attack during combat."""
-        try:
-            user_id = ctx.author.id
-            
-            # Check if in combat
-            status = self.game_engine.get_player_status(user_id)
-            if not status or not status.get('in_combat'):
-                embed = discord.Embed(
-                    title="❌ Not in Combat",
-                    description="You are not currently in combat.",
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Attack
-            result = self.game_engine.attack_enemy(user_id)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Attack Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Create combat embed
-            embed = await self._create_combat_embed(result)
+        user_id = ctx.author.id
+        
+        # Check if in combat
+        status, cache_key = await self._get_cached_status(user_id)
+        if not status or not status.in_combat:
+            await _send_error(ctx, "❌ Not in Combat", "You are not currently in combat.")
+            return
+        
+        # Attack
+        result = await asyncio.to_thread(self.game_engine.attack_enemy, user_id)
+        
+        if 'error' in result:
+            await _send_error(ctx, "❌ Attack Error", result['error'])
+            return
+        
+        # Create combat embed
+        embed = self._create_combat_embed(result)
+        
+        # Handle different combat outcomes
+        if result.get('type') in ['victory', 'defeat']:
+            # Invalidate before sending; the mutation already happened
+            self.bot.cache_manager.invalidate_many((cache_key,))
             
-            # Handle different combat outcomes
-            if result.get('type') in ['victory', 'defeat']:
-                # Combat ended - show result with choices
-                if 'choices' in result:
-                    view = ChoiceView(self.bot, result['choices'])
-                    await ctx.send(embed=embed, view=view)
-                else:
-                    await ctx.send(embed=embed)
-                
-                # Invalidate caches
-                self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
-            else:
-                # Combat continues - show attack options
-                view = CombatView(self.bot)
+            # Combat ended - show result with choices
+            if 'choices' in result:
+                view = ChoiceView(self.bot, result['choices'])
                 await ctx.send(embed=embed, view=view)
-            
-        except Exception as e:
-            self.logger.error(f"Error in attack command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to attack. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
+            else:
+                await ctx.send(embed=embed)
+        else:
+            # Combat continues - show attack options
+            view = CombatView(self.bot)
+            await ctx.send(embed=embed, view=view)
     
     @commands.command(name='use')
+    @_safe_command("use command", "Failed to use item. Please try again.")
     async def use_command(self, ctx, *, item_name: str):
         """Use an item from your inventory."""
-        try:
-            if not item_name:
-                embed = discord.Embed(
-                    title="❌ Missing Item",
-                    description="Please specify an item to use: `!use <item_name>`",
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            user_id = ctx.author.id
-            result = self.game_engine.use_item(user_id, item_name)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Use Item Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await ctx.send(embed=embed)
-                return
-            
-            # Create use item embed
-            embed = discord.Embed(
-                title="🔧 Using Item",
-                description=result['message'],
-                color=self.bot.config.get_color('success')
-            )
-            
-            # Add effects
-            if 'health_restored' in result:
-                embed.add_field(
-                    name="❤️ Health Restored",
-                    value=str(result['health_restored']),
-                    inline=True
-                )
-            
-            if 'experience_gained' in result:
-                embed.add_field(
-                    name="✨ Experience Gained",
-                    value=str(result['experience_gained']),
-                    inline=True
-                )
-            
-            await ctx.send(embed=embed)
-            
-            # Invalidate caches
-            self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
-            
-        except Exception as e:
-            self.logger.error(f"Error in use command: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to use item. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await ctx.send(embed=embed)
-    
-    async def _create_status_embed(self, user, status):
-        """Create a status embed."""
-        stats = status['stats']
+        if not item_name:
+            await _send_error(ctx, "❌ Missing Item", "Please specify an item to use: `!use <item_name>`")
+            return
         
-        embed = discord.Embed(
-            title="📊 Character Status",
-            color=self.bot.config.get_color('status')
-        )
+        user_id = ctx.author.id
+        result = await asyncio.to_thread(self.game_engine.use_item, user_id, item_name)
         
-        embed.add_field(
-            name="❤️ Health",
-            value=f"{stats['health']}/{stats['max_health']}",
-            inline=True
-        )
+        if 'error' in result:
+            await _send_error(ctx, "❌ Use Item Error", result['error'])
+            return
         
-        embed.add_field(
-            name="⭐ Level",
-            value=str(stats['level']),
-            inline=True
+        # Create use item embed
+        embed = discord.Embed(
+            title="🔧 Using Item",
+            description=result['message'],
+            color=self._colors['success']
         )
         
-        embed.add_field(
-            name="✨ Experience",
-            value=f"{stats['experience']}/{stats['level'] * self.bot.config.game_config['experience_per_level']}",
-            inline=True
-        )
+        # Add effects
+        if 'health_restored' in result:
+            embed.add_field(
+                name="❤️ Health Restored",
+                value=str(result['health_restored']),
+                inline=True
+            )
         
-        embed.add_field(
-            name="💰 Gold",
-            value=str(stats['gold']),
-            inline=True
-        )
+        if 'experience_gained' in result:
+            embed.add_field(
+                name="✨ Experience Gained",
+                value=str(result['experience_gained']),
+                inline=True
+            )
         
-        embed.add_field(
-            name="📍 Location",
-            value=stats['current_location'],
-            inline=True
-        )
+        # Invalidate before sending
+        self.bot.cache_manager.invalidate_many((f"status_{user_id}",))
         
-        embed.add_field(
-            name="📖 Story Progress",
-            value=str(stats['story_progress']),
-            inline=True
+        await ctx.send(embed=embed)
+    
+    async def _create_status_embed(self, user, status):
+        """Create a status embed from a _PlayerStatus."""
+        embed = discord.Embed(
+            title="📊 Character Status",
+            color=self._colors['status']
         )
         
-        if status['in_combat']:
-            combat = status['combat_info']
-            embed.add_field(
-                name="⚔️ In Combat",
-                value=f"{combat['enemy_name']} ({combat['enemy_health']}/{combat['enemy_max_health']} HP)",
-                inline=False
-            )
+        fields = [
+            {'name': "❤️ Health", 'value': f"{status.health}/{status.max_health}", 'inline': True},
+            {'name': "⭐ Level", 'value': str(status.level), 'inline': True},
+            {'name': "✨ Experience", 'value': f"{status.experience}/{status.level * self._xp_per_level}", 'inline': True},
+            {'name': "💰 Gold", 'value': str(status.gold), 'inline': True},
+            {'name': "📍 Location", 'value': status.current_location, 'inline': True},
+            {'name': "📖 Story Progress", 'value': str(status.story_progress), 'inline': True},
+        ]
+        
+        if status.in_combat:
+            combat = status.combat_info
+            fields.append({
+                'name': "⚔️ In Combat",
+                'value': f"{combat['enemy_name']} ({combat['enemy_health']}/{combat['enemy_max_health']} HP)",
+                'inline': False
+            })
         
         # Inventory summary
-        if status['inventory']:
-            embed.add_field(
-                name="🎒 Inventory",
-                value=f"{len(status['inventory'])} items",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="🎒 Inventory",
-                value="Empty",
-                inline=False
-            )
+        fields.append({
+            'name': "🎒 Inventory",
+            'value': f"{status.inventory_count} items" if status.inventory_count else "Empty",
+            'inline': False
+        })
         
-        return embed
+        return _set_fields(embed, fields)
     
     async def _create_inventory_embed(self, inventory):
         """Create an inventory embed."""
         embed = discord.Embed(
             title="🎒 Inventory",
-            color=self.bot.config.get_color('inventory')
+            color=self._colors['inventory']
         )
         
-        for item in inventory:
-            embed.add_field(
-                name=f"📦 {item['name']} (x{item['quantity']})",
-                value=f"Type: {item['type'].title()}\nEffect: {item['effect'].title()}\nValue: {item['value']}\n{item['description']}",
-                inline=False
-            )
+        _set_fields(embed, [
+            {
+                'name': f"📦 {item['name']} (x{item['quantity']})",
+                'value': "\n".join((
+                    f"Type: {item['type_title']}",
+                    f"Effect: {item['effect_title']}",
+                    f"Value: {item['value']}",
+                    item['description']
+                )),
+                'inline': False
+            }
+            for item in inventory
+        ])
         
         embed.set_footer(text=f"Total items: {len(inventory)}")
         return embed
     
-    async def _create_combat_embed(self, result):
+    def _create_combat_embed(self, result):
         """Create a combat embed."""
         embed = discord.Embed(
             title="⚔️ Combat",
             description=result['message'],
-            color=self.bot.config.get_color('combat')
+            color=self._colors['combat']
         )
         
         if 'enemy_attack' in result:
@@ -499,7 +557,7 @@ class GameCommands(commands.Cog):
         
         # Handle victory/defeat
         if result.get('type') == 'victory':
-            embed.color = self.bot.config.get_color('victory')
+            embed.color = self._colors['victory']
             embed.add_field(
                 name="🎉 VICTORY!",
                 value=f"Experience gained: {result['experience_gained']}",
@@ -514,7 +572,7 @@ class GameCommands(commands.Cog):
                 )
         
         elif result.get('type') == 'defeat':
-            embed.color = self.bot.config.get_color('defeat')
+            embed.color = self._colors['defeat']
             embed.add_field(
                 name="💀 DEFEAT",
                 value=f"Health restored: {result['health_restored']}",
@@ -528,62 +586,53 @@ class ChoiceView(discord.ui.View):
     """View for choice buttons."""
     
     def __init__(self, bot, choices):
-        super().__init__(timeout=bot.config.get_timeout('choice'))
+        super().__init__(timeout=bot._view_timeouts['choice'])
         self.bot = bot
+        self._colors = _get_colors(bot.config)
         self.choices = choices
         
-        # Add choice buttons
-        for i, choice in enumerate(choices, 1):
-            button = discord.ui.Button(
+        # Add choice buttons, all sharing one bound callback
+        callback = self.choice_callback
+        for button in [
+            discord.ui.Button(
                 label=f"{i}. {choice}",
                 custom_id=f"choice_{i}",
                 style=discord.ButtonStyle.primary
             )
-            button.callback = self.choice_callback
+            for i, choice in enumerate(choices, 1)
+        ]:
+            button.callback = callback
             self.add_item(button)
     
+    @_safe_callback("choice callback", "Failed to process choice. Please try again.")
     async def choice_callback(self, interaction):
         """Handle choice button clicks."""
-        try:
-            choice_number = int(interaction.data['custom_id'].split('_')[1])
-            user_id = interaction.user.id
-            
-            # Make choice
-            result = self.bot.game_engine.make_choice(user_id, choice_number)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-                return
-            
-            # Create result embed
-            embed = discord.Embed(
-                title="🎯 Your Choice",
-                description=result['message'],
-                color=self.bot.config.get_color('info')
-            )
-            
-            # Add new choices if available
-            if 'choices' in result:
-                view = ChoiceView(self.bot, result['choices'])
-                await interaction.response.edit_message(embed=embed, view=view)
-            else:
-                await interaction.response.edit_message(embed=embed, view=None)
-            
-            # Invalidate caches
-            self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
-            
-        except Exception as e:
-            self.bot.logger.error(f"Error in choice callback: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to process choice. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
+        # custom_id is always "choice_<n>"; slice past the prefix
+        choice_number = int(interaction.data['custom_id'][7:])
+        user_id = interaction.user.id
+        
+        # Make choice
+        result = await asyncio.to_thread(self.bot.game_engine.make_choice, user_id, choice_number)
+        
+        if 'error' in result:
+            await _send_error(interaction, "❌ Error", result['error'])
+            return
+        
+        # Create result embed
+        embed = discord.Embed(
+            title="🎯 Your Choice",
+            description=result['message'],
+            color=self._colors['info']
+        )
+        
+        # Invalidate before responding
+        self.bot.cache_manager.invalidate_many((f"status_{user_id}",))
+        
+        # Add new choices if available
+        if 'choices' in result:
+            view = ChoiceView(self.bot, result['choices'])
+            await interaction.response.edit_message(embed=embed, view=view)
+        else:
             await interaction.response.edit_message(embed=embed, view=None)
 
 
@@ -591,130 +640,116 @@ class CombatView(discord.ui.View):
     """View for combat buttons."""
     
     def __init__(self, bot):
-        super().__init__(timeout=bot.config.get_timeout('combat'))
+        super().__init__(timeout=bot._view_timeouts['combat'])
         self.bot = bot
+        self._colors = _get_colors(bot.config)
     
     @discord.ui.button(label="⚔️ Attack", style=discord.ButtonStyle.danger)
+    @_safe_callback("attack button", "Failed to attack. Please try again.")
     async def attack_button(self, interaction, button):
         """Attack button callback."""
-        try:
-            user_id = interaction.user.id
-            result = self.bot.game_engine.attack_enemy(user_id)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-                return
-            
-            # Create combat embed
-            embed = discord.Embed(
-                title="⚔️ Combat",
-                description=result['message'],
-                color=self.bot.config.get_color('combat')
-            )
-            
-            if 'enemy_attack' in result:
-                embed.add_field(
-                    name="Enemy Attack",
-                    value=result['enemy_attack'],
-                    inline=False
-                )
-            
-            if 'enemy_health' in result:
-                embed.add_field(
-                    name="👹 Enemy Health",
-                    value=f"{result['enemy_health']}/{result['enemy_max_health']}",
-                    inline=True
-                )
-            
-            if 'player_health' in result:
-                embed.add_field(
-                    name="❤️ Your Health",
-                    value=str(result['player_health']),
-                    inline=True
-                )
+        user_id = interaction.user.id
+        result = await asyncio.to_thread(self.bot.game_engine.attack_enemy, user_id)
+        
+        if 'error' in result:
+            await _send_error(interaction, "❌ Error", result['error'])
+            return
+        
+        # Build the embed through the cog's shared builder so the
+        # command and button paths cannot drift apart
+        embed = self.bot.get_cog('GameCommands')._create_combat_embed(result)
+        
+        # Handle combat outcome
+        if result.get('type') in ['victory', 'defeat']:
+            # Invalidate before responding
+            self.bot.cache_manager.invalidate_many((f"status_{user_id}",))
             
-            # Handle combat outcome
-            if result.get('type') in ['victory', 'defeat']:
-                if 'choices' in result:
-                    view = ChoiceView(self.bot, result['choices'])
-                    await interaction.response.edit_message(embed=embed, view=view)
-                else:
-                    await interaction.response.edit_message(embed=embed, view=None)
-                
-                # Invalidate caches
-                self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
+            if 'choices' in result:
+                view = ChoiceView(self.bot, result['choices'])
+                await interaction.response.edit_message(embed=embed, view=view)
             else:
-                # Combat continues
-                await interaction.response.edit_message(embed=embed, view=self)
-            
-        except Exception as e:
-            self.bot.logger.error(f"Error in attack button: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to attack. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await interaction.response.edit_message(embed=embed, view=None)
+                await interaction.response.edit_message(embed=embed, view=None)
+        else:
+            # Combat continues
+            await interaction.response.edit_message(embed=embed, view=self)
     
     @discord.ui.button(label="🎒 Use Item", style=discord.ButtonStyle.secondary)
+    @_safe_callback("use item button", "Failed to show items. Please try again.")
     async def use_item_button(self, interaction, button):
         """Use item button callback."""
-        try:
-            user_id = interaction.user.id
-            
-            # Get user's inventory
-            status = self.bot.game_engine.get_player_status(user_id)
-            if not status or not status['inventory']:
-                embed = discord.Embed(
-                    title="❌ No Items",
-                    description="You have no items to use!",
-                    color=self.bot.config.get_color('error')
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-                return
-            
-            # Create item selection view
-            view = ItemSelectionView(self.bot, status['inventory'])
-            embed = discord.Embed(
-                title="🎒 Select Item to Use",
-                description="Choose an item from your inventory:",
-                color=self.bot.config.get_color('inventory')
-            )
-            
-            await interaction.response.edit_message(embed=embed, view=view)
-            
-        except Exception as e:
-            self.bot.logger.error(f"Error in use item button: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to show items. Please try again.",
-                color=self.bot.config.get_color('error')
-            )
-            await interaction.response.edit_message(embed=embed, view=None)
+        user_id = interaction.user.id
+        
+        # Get user's inventory
+        status = await asyncio.to_thread(self.bot.game_engine.get_player_status, user_id)
+        if not status or not status['inventory']:
+            await _send_error(interaction, "❌ No Items", "You have no items to use!")
+            return
+        
+        # Create item selection view
+        view = ItemSelectionView(self.bot, status['inventory'])
+        embed = _static_embed(
+            'item_select', "🎒 Select Item to Use",
+            "Choose an item from your inventory:", 'inventory'
+        )
+        
+        await interaction.response.edit_message(embed=embed, view=view)
+
+
+# Discord caps a select menu at 25 options; larger inventories paginate
+_SELECT_PAGE_SIZE = 25
 
 
 class ItemSelectionView(discord.ui.View):
     """View for item selection."""
     
     def __init__(self, bot, inventory):
-        super().__init__(timeout=bot.config.get_timeout('item_selection'))
+        super().__init__(timeout=bot._view_timeouts['item_selection'])
         self.bot = bot
+        self._colors = _get_colors(bot.config)
         self.inventory = inventory
+        self._page = 0
+        self._build_items()
+    
+    def _build_items(self):
+        """(Re)build the components for the current page.
         
-        # Add item buttons
-        for item in inventory:
-            button = discord.ui.Button(
-                label=f"Use {item['name']}",
-                custom_id=f"use_{item['name']}",
-                style=discord.ButtonStyle.primary
-            )
-            button.callback = self.item_callback
-            self.add_item(button)
+        A single select menu replaces the old one-button-per-item layout,
+        which allocated N components and broke past Discord's 25-component
+        cap on large inventories.
+        """
+        self.clear_items()
+        start = self._page * _SELECT_PAGE_SIZE
+        page_items = self.inventory[start:start + _SELECT_PAGE_SIZE]
+        
+        select = discord.ui.Select(
+            custom_id="item_select",
+            placeholder="Choose an item to use...",
+            options=[
+                discord.SelectOption(label=item['name'], value=item['name'])
+                for item in page_items
+            ]
+        )
+        select.callback = self.item_callback
+        self.add_item(select)
+        
+        if len(self.inventory) > _SELECT_PAGE_SIZE:
+            prev_button = discord.ui.Button(
+                label="◀ Prev",
+                custom_id="item_prev",
+                style=discord.ButtonStyle.secondary,
+                disabled=self._page == 0
+            )
+            prev_button.callback = self.prev_callback
+            self.add_item(prev_button)
+            
+            next_button = discord.ui.Button(
+                label="Next ▶",
+                custom_id="item_next",
+                style=discord.ButtonStyle.secondary,
+                disabled=start + _SELECT_PAGE_SIZE >= len(self.inventory)
+            )
+            next_button.callback = self.next_callback
+            self.add_item(next_button)
         
         # Add cancel button
         cancel_button = discord.ui.Button(
@@ -725,69 +760,71 @@ class ItemSelectionView(discord.ui.View):
         cancel_button.callback = self.cancel_callback
         self.add_item(cancel_button)
     
+    async def prev_callback(self, interaction):
+        """Show the previous page of items."""
+        self._page -= 1
+        self._build_items()
+        await interaction.response.edit_message(view=self)
+    
+    async def next_callback(self, interaction):
+        """Show the next page of items."""
+        self._page += 1
+        self._build_items()
+        await interaction.response.edit_message(view=self)
+    
+    @_safe_callback("item callback", "Failed to use item. Please try again.")
     async def item_callback(self, interaction):
-        """Handle item button clicks."""
-        try:
-            item_name = interaction.data['custom_id'][4:]  # Remove "use_" prefix
-            user_id = interaction.user.id
-            
-            # Use item
-            result = self.bot.game_engine.use_item(user_id, item_name)
-            
-            if 'error' in result:
-                embed = discord.Embed(
-                    title="❌ Error",
-                    description=result['error'],
-                    color=self.bot.config.get_color('error')
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-                return
-            
-            # Create result embed
-            embed = discord.Embed(
-                title="🔧 Using Item",
-                description=result['message'],
-                color=self.bot.config.get_color('success')
+        """Handle item selection."""
+        item_name = interaction.data['values'][0]
+        user_id = interaction.user.id
+        
+        # Use item
+        result = await asyncio.to_thread(self.bot.game_engine.use_item, user_id, item_name)
+        
+        if 'error' in result:
+            await _send_error(interaction, "❌ Error", result['error'])
+            return
+        
+        # Create result embed
+        embed = discord.Embed(
+            title="🔧 Using Item",
+            description=result['message'],
+            color=self._colors['success']
+        )
+        
+        if 'health_restored' in result:
+            embed.add_field(
+                name="❤️ Health Restored",
+                value=str(result['health_restored']),
+                inline=True
             )
-            
-            if 'health_restored' in result:
-                embed.add_field(
-                    name="❤️ Health Restored",
-                    value=str(result['health_restored']),
-                    inline=True
-                )
-            
-            if 'experience_gained' in result:
-                embed.add_field(
-                    name="✨ Experience Gained",
-                    value=str(result['experience_gained']),
-                    inline=True
-                )
-            
-            await interaction.response.edit_message(embed=embed, view=None)
-            
-            # Invalidate caches
-            self.bot.cache_manager.invalidate_game_state(f"status_{user_id}")
-            
-        except Exception as e:
-            self.bot.logger.error(f"Error in item callback: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to use item. Please try again.",
-                color=self.bot.config.get_color('error')
+        
+        if 'experience_gained' in result:
+            embed.add_field(
+                name="✨ Experience Gained",
+                value=str(result['experience_gained']),
+                inline=True
             )
-            await interaction.response.edit_message(embed=embed, view=None)
+        
+        # Invalidate before responding
+        self.bot.cache_manager.invalidate_many((f"status_{user_id}",))
+        
+        await interaction.response.edit_message(embed=embed, view=None)
     
     async def cancel_callback(self, interaction):
         """Handle cancel button click."""
-        embed = discord.Embed(
-            title="❌ Cancelled",
-            description="Item selection cancelled.",
-            color=self.bot.config.get_color('warning')
+        embed = _static_embed(
+            'cancelled', "❌ Cancelled", "Item selection cancelled.", 'warning'
         )
         await interaction.response.edit_message(embed=embed, view=None)
 
 
 async def setup(bot):
     """Set up the game commands cog."""
+    # View timeouts are static config; resolve them once here instead of
+    # on every view construction
+    bot._view_timeouts = {
+        key: bot.config.get_timeout(key)
+        for key in ('choice', 'combat', 'item_selection')
+    }
     await bot.add_cog(GameCommands(bot))
\ No newline at end of file
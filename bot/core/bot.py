@@ -12,6 +12,8 @@ Features:
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from pathlib import Path
@@ -21,10 +23,31 @@ from discord.ext import commands, tasks
 
 from .config import Config
 from .exceptions import BotInitializationError
-from .logger import get_logger
+from .logger import get_logger, shutdown_logging
 from ..utils.cache import CacheManager
 from ..utils.rate_limiter import CommandRateLimiter, APIRateLimiter
 
+# discord.py 2.x serializes payloads with orjson automatically when it is
+# importable; patch _to_json ourselves only on builds that predate that
+# detection so large embeds still take the fast path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None and not getattr(discord.utils, 'HAS_ORJSON', False):
+    discord.utils._to_json = lambda obj: orjson.dumps(obj).decode('utf-8')
+
+
+@dataclass(slots=True)
+class _PerfStats:
+    """Counters bumped on every command; attribute stores are cheaper
+    than string-keyed dict updates on this path."""
+    avg_response_time: float = 0.0
+    total_commands: int = 0
+    total_errors: int = 0
+    uptime_seconds: float = 0.0
+
 
 class DungeonMasterBot(commands.Bot):
     """
@@ -55,37 +78,56 @@ class DungeonMasterBot(commands.Bot):
             command_prefix=config.command_prefix,
             intents=intents,
             help_command=None,  # Custom help command
-            max_messages=10000,  # Cache size for message history
+            max_messages=None,  # No cog reads message history; skip the 10k ring
             chunk_guilds_at_startup=False  # Disable for performance
         )
         
         # Initialize core components
         self._initialize_components()
         
+        # Prefix cached off the config for the per-message fast path
+        self._prefix = config.command_prefix
+        
         # Bot metadata
         self.start_time = datetime.utcnow()
+        # Monotonic baseline for uptime math and the start string rendered
+        # once; wall-clock formatting per request is wasted work
+        self._start_mono = time.monotonic()
+        self._start_str = self.start_time.strftime("%Y-%m-%d %H:%M:%S UTC")
+        # (timestamp, value) for the formatted uptime; the string only
+        # changes once a second, stats polling hits it far more often
+        self._uptime_cache = (0.0, "")
+        # Populated by _start_background_tasks; close() must not trip
+        # over it when startup fails before setup_hook ran
+        self._background_loops = ()
         self.error_count = 0
         self.command_count = 0
         self.message_count = 0
         
         # Performance tracking
-        self.performance_stats = {
-            'avg_response_time': 0.0,
-            'total_commands': 0,
-            'total_errors': 0,
-            'uptime_seconds': 0
-        }
+        self.performance_stats = _PerfStats()
         
         # Set up event handlers
         self._setup_event_handlers()
         
-        # Load cogs
-        self._load_cogs()
+        self.logger.info("Bot initialized successfully")
+    
+    async def setup_hook(self) -> None:
+        """Async initialization run by discord.py once the loop exists.
         
-        # Start background tasks
+        Cogs and background loops both need the running loop, so they
+        are wired up here rather than in __init__.
+        """
+        await self._load_cogs()
         self._start_background_tasks()
         
-        self.logger.info("Bot initialized successfully")
+        # Register hybrid commands as slash commands; once per process,
+        # not in on_ready, which re-fires on every reconnect and would
+        # hammer the heavily rate-limited sync endpoint
+        try:
+            await self.tree.sync()
+        except Exception as e:
+            self.logger.error(f"Failed to sync command tree: {e}")
     
     def _initialize_components(self) -> None:
         """Initialize core bot components."""
@@ -97,6 +139,28 @@ class DungeonMasterBot(commands.Bot):
             self.command_rate_limiter = CommandRateLimiter(self.config)
             self.api_rate_limiter = APIRateLimiter()
             
+            # Static error embeds built once; the handlers just send
+            # them, so error bursts allocate nothing
+            self._embed_perm_denied = discord.Embed(
+                title="❌ Permission Denied",
+                description="You don't have permission to use this command.",
+                color=self.config.color_error
+            )
+            self._embed_bot_perms = discord.Embed(
+                title="❌ Bot Permission Error",
+                description="I don't have the required permissions to execute this command.",
+                color=self.config.color_error
+            )
+            self._embed_unexpected = discord.Embed(
+                title="❌ Unexpected Error",
+                description="An unexpected error occurred. Please try again later.",
+                color=self.config.color_error
+            )
+            # Constant tail of the command-not-found message
+            self._not_found_suffix = (
+                f"\nUse `{self.config.command_prefix}help` to see available commands."
+            )
+            
             # Initialize game components (will be loaded from existing modules)
             self._load_game_components()
             
@@ -139,22 +203,24 @@ class DungeonMasterBot(commands.Bot):
             await self.change_presence(
                 activity=discord.Game(name=self.config.bot_status)
             )
+
             
             # Update performance stats
-            self.performance_stats['uptime_seconds'] = (
-                datetime.utcnow() - self.start_time
-            ).total_seconds()
+            self.performance_stats.uptime_seconds = (
+                time.monotonic() - self._start_mono
+            )
         
         @self.event
         async def on_command(ctx):
             """Called when a command is executed."""
             self.command_count += 1
-            self.performance_stats['total_commands'] += 1
+            self.performance_stats.total_commands += 1
             
             # Log command execution
             self.logger.info(
-                f"Command executed: {ctx.command.name} by {ctx.author} "
-                f"in {ctx.guild.name if ctx.guild else 'DM'}"
+                "Command executed: %s by %s in %s",
+                ctx.command.name, ctx.author,
+                ctx.guild.name if ctx.guild else 'DM'
             )
         
         @self.event
@@ -166,17 +232,28 @@ class DungeonMasterBot(commands.Bot):
             
             self.message_count += 1
             
+            # Most traffic is not a command; skip the parser entirely
+            # unless the prefix is present or the bot is mentioned
+            if (not message.content.startswith(self._prefix)
+                    and self.user not in message.mentions):
+                return
+            
             # Process commands
             await self.process_commands(message)
         
         @self.event
         async def on_command_error(ctx, error):
             """Global command error handler."""
+            # Defer to cog-local handlers, mirroring the default
+            # Bot.on_command_error behaviour this override replaced
+            if ctx.cog is not None and ctx.cog.has_error_handler():
+                return
+            
             self.error_count += 1
-            self.performance_stats['total_errors'] += 1
+            self.performance_stats.total_errors += 1
             
             # Log the error
-            self.logger.error(f"Command error: {error}", exc_info=True)
+            self.logger.error("Command error: %s", error, exc_info=True)
             
             # Handle specific error types
             if isinstance(error, commands.CommandNotFound):
@@ -189,6 +266,10 @@ class DungeonMasterBot(commands.Bot):
                 await self._handle_command_cooldown(ctx, error)
             elif isinstance(error, commands.MissingRequiredArgument):
                 await self._handle_missing_argument(ctx, error)
+            elif isinstance(error, commands.CheckFailure):
+                # Cog checks message their own denials (game availability,
+                # rate limits); nothing more to send here
+                pass
             else:
                 await self._handle_unexpected_error(ctx, error)
         
@@ -196,43 +277,33 @@ class DungeonMasterBot(commands.Bot):
         async def on_error(event, *args, **kwargs):
             """Global error handler."""
             self.error_count += 1
-            self.performance_stats['total_errors'] += 1
+            self.performance_stats.total_errors += 1
             
-            self.logger.error(f"Error in event {event}: {args}", exc_info=True)
+            self.logger.error("Error in event %s: %s", event, args, exc_info=True)
     
     async def _handle_command_not_found(self, ctx):
         """Handle command not found errors."""
         embed = discord.Embed(
             title="❌ Command Not Found",
-            description=f"Command `{ctx.message.content.split()[0]}` not found.\nUse `{self.config.command_prefix}help` to see available commands.",
-            color=self.config.get_color('error')
+            description=f"Command `{ctx.message.content.split()[0]}` not found.{self._not_found_suffix}",
+            color=self.config.color_error
         )
         await ctx.send(embed=embed)
     
     async def _handle_missing_permissions(self, ctx):
         """Handle missing permissions errors."""
-        embed = discord.Embed(
-            title="❌ Permission Denied",
-            description="You don't have permission to use this command.",
-            color=self.config.get_color('error')
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._embed_perm_denied)
     
     async def _handle_bot_missing_permissions(self, ctx):
         """Handle bot missing permissions errors."""
-        embed = discord.Embed(
-            title="❌ Bot Permission Error",
-            description="I don't have the required permissions to execute this command.",
-            color=self.config.get_color('error')
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._embed_bot_perms)
     
     async def _handle_command_cooldown(self, ctx, error):
         """Handle command cooldown errors."""
         embed = discord.Embed(
             title="⏰ Command on Cooldown",
             description=f"Please wait {error.retry_after:.1f} seconds before using this command again.",
-            color=self.config.get_color('warning')
+            color=self.config.color_warning
         )
         await ctx.send(embed=embed)
     
@@ -241,39 +312,32 @@ class DungeonMasterBot(commands.Bot):
         embed = discord.Embed(
             title="❌ Missing Argument",
             description=f"Missing required argument: `{error.param.name}`",
-            color=self.config.get_color('error')
+            color=self.config.color_error
         )
         await ctx.send(embed=embed)
     
     async def _handle_unexpected_error(self, ctx, error):
         """Handle unexpected errors."""
-        embed = discord.Embed(
-            title="❌ Unexpected Error",
-            description="An unexpected error occurred. Please try again later.",
-            color=self.config.get_color('error')
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._embed_unexpected)
     
-    def _load_cogs(self) -> None:
-        """Load all command cogs."""
-        try:
-            # Import and load cogs
-            from ..cogs.game_commands import GameCommands
-            from ..cogs.admin_commands import AdminCommands
-            from ..cogs.utility_commands import UtilityCommands
-            
-            # Add cogs
-            self.add_cog(GameCommands(self))
-            self.add_cog(AdminCommands(self))
-            self.add_cog(UtilityCommands(self))
-            
-            self.logger.info("Successfully loaded all cogs")
-            
-        except ImportError as e:
-            self.logger.warning(f"Could not load some cogs: {e}")
-        except Exception as e:
-            self.logger.error(f"Error loading cogs: {e}")
-            raise BotInitializationError(f"Cog loading failed: {e}")
+    async def _load_cogs(self) -> None:
+        """Load all command cogs, skipping any that fail."""
+        extensions = (
+            'bot.cogs.game_commands',
+            'bot.cogs.admin_commands',
+            'bot.cogs.utility_commands'
+        )
+        loaded = 0
+        for extension in extensions:
+            try:
+                await self.load_extension(extension)
+                loaded += 1
+            except commands.ExtensionError as e:
+                # One broken cog should not take the whole bot down;
+                # log it and keep serving the cogs that do load
+                self.logger.error("Failed to load extension %s: %s", extension, e)
+
+        self.logger.info("Loaded %d/%d cogs", loaded, len(extensions))
     
     def _start_background_tasks(self) -> None:
         """Start background maintenance tasks."""
@@ -282,25 +346,27 @@ class DungeonMasterBot(commands.Bot):
         async def cleanup_task():
             """Periodic cleanup task."""
             try:
-                # Clean up caches
-                cache_stats = self.cache_manager.cleanup_all()
-                
-                # Clean up rate limiters
-                command_cleanup = self.command_rate_limiter.cleanup()
-                api_cleanup = self.api_rate_limiter.cleanup()
+                # Clean up caches and rate limiters off the event loop;
+                # the sweeps are O(tracked entries) of pure-Python work
+                # and would stall gateway dispatch if run inline
+                cache_stats, command_cleanup, api_cleanup = await asyncio.gather(
+                    asyncio.to_thread(self.cache_manager.cleanup_all),
+                    asyncio.to_thread(self.command_rate_limiter.cleanup),
+                    asyncio.to_thread(self.api_rate_limiter.cleanup)
+                )
                 
                 # Update performance stats
-                self.performance_stats['uptime_seconds'] = (
-                    datetime.utcnow() - self.start_time
-                ).total_seconds()
+                self.performance_stats.uptime_seconds = (
+                    time.monotonic() - self._start_mono
+                )
                 
                 self.logger.info(
-                    f"Cleanup completed - Cache: {cache_stats}, "
-                    f"Rate limits: {command_cleanup + api_cleanup}"
+                    "Cleanup completed - Cache: %s, Rate limits: %s",
+                    cache_stats, command_cleanup + api_cleanup
                 )
                 
             except Exception as e:
-                self.logger.error(f"Error in cleanup task: {e}")
+                self.logger.error("Error in cleanup task: %s", e)
         
         @tasks.loop(minutes=5)
         async def stats_task():
@@ -308,52 +374,66 @@ class DungeonMasterBot(commands.Bot):
             try:
                 # Calculate average response time (simplified)
                 if self.command_count > 0:
-                    self.performance_stats['avg_response_time'] = (
-                        self.performance_stats['uptime_seconds'] / self.command_count
+                    self.performance_stats.avg_response_time = (
+                        self.performance_stats.uptime_seconds / self.command_count
                     )
                 
                 # Log performance stats periodically
                 if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Performance stats: {self.performance_stats}")
+                    self.logger.debug("Performance stats: %s", self.performance_stats)
                 
             except Exception as e:
-                self.logger.error(f"Error in stats task: {e}")
+                self.logger.error("Error in stats task: %s", e)
         
-        # Start tasks
+        # Start tasks, keeping handles so close() can cancel just these
         cleanup_task.start()
         stats_task.start()
+        self._background_loops = (cleanup_task, stats_task)
         
         self.logger.info("Background tasks started")
     
     def get_uptime(self) -> str:
-        """Get bot uptime as a formatted string."""
-        uptime = datetime.utcnow() - self.start_time
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
+        """Get bot uptime as a formatted string, cached for one second."""
+        now = time.monotonic()
+        cached_at, cached = self._uptime_cache
+        if now - cached_at < 1.0:
+            return cached
+        
+        elapsed = int(now - self._start_mono)
+        days, remainder = divmod(elapsed, 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         if days > 0:
-            return f"{days}d {hours}h {minutes}m"
+            uptime = f"{days}d {hours}h {minutes}m"
         elif hours > 0:
-            return f"{hours}h {minutes}m"
+            uptime = f"{hours}h {minutes}m"
         else:
-            return f"{minutes}m {seconds}s"
+            uptime = f"{minutes}m {seconds}s"
+        
+        self._uptime_cache = (now, uptime)
+        return uptime
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive bot statistics."""
         return {
             'uptime': self.get_uptime(),
             'guilds': len(self.guilds),
-            'users': sum(len(guild.members) for guild in self.guilds),
+            # member_count is the gateway's cached figure; guild.members
+            # is mostly empty with chunk_guilds_at_startup=False and
+            # iterating it is O(total members) when it isn't
+            'users': sum(guild.member_count or 0 for guild in self.guilds),
             'commands_executed': self.command_count,
             'messages_processed': self.message_count,
             'errors': self.error_count,
             'latency': round(self.latency * 1000, 2),  # in milliseconds
-            'performance': self.performance_stats,
+            'performance': asdict(self.performance_stats),
             'cache': self.cache_manager.get_stats(),
+            # Read-only counts; the sweeps belong to cleanup_task, not
+            # to a stats read
             'rate_limits': {
-                'command_cleanup': self.command_rate_limiter.cleanup(),
-                'api_cleanup': self.api_rate_limiter.cleanup()
+                'command_active': self.command_rate_limiter.active_count,
+                'api_active': self.api_rate_limiter.active_count
             }
         }
     
@@ -361,7 +441,7 @@ class DungeonMasterBot(commands.Bot):
         """Start the bot."""
         try:
             self.logger.info("Starting Discord bot...")
-            await self.start(self.config.discord_token)
+            await super().start(self.config.discord_token)
         except Exception as e:
             self.logger.error(f"Failed to start bot: {e}")
             raise BotInitializationError(f"Bot startup failed: {e}")
@@ -370,12 +450,25 @@ class DungeonMasterBot(commands.Bot):
         """Clean shutdown of the bot."""
         self.logger.info("Shutting down bot...")
         
-        # Cancel background tasks
-        for task in asyncio.all_tasks():
-            if not task.done():
-                task.cancel()
-        
+        # Cancel only the loops this class owns; sweeping
+        # asyncio.all_tasks() also cancelled discord.py internals that
+        # super().close() needs to drain the connection cleanly
+        pending = []
+        for loop in self._background_loops:
+            task = loop.get_task()
+            loop.cancel()
+            if task is not None and not task.done():
+                pending.append(task)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Drain the outbound batcher while the HTTP session is still open
+        outbound = getattr(self, 'outbound', None)
+        if outbound is not None:
+            await outbound.close()
+
         # Close bot
         await super().close()
         
-        self.logger.info("Bot shutdown complete")
\ No newline at end of file
+        self.logger.info("Bot shutdown complete")
+        shutdown_logging()
\ No newline at end of file
@@ -11,6 +11,20 @@ from pathlib import Path
 
 from .exceptions import ConfigurationError
 
+# Default embed palette, pre-parsed so startup only pays int(x, 16) for
+# colors actually overridden in the environment
+_DEFAULT_COLORS = {
+    'success': 0x00ff00,
+    'error': 0xff0000,
+    'warning': 0xffa500,
+    'info': 0x0099ff,
+    'combat': 0xff4444,
+    'victory': 0x00ff00,
+    'defeat': 0x8b0000,
+    'inventory': 0xffd700,
+    'status': 0x0099ff
+}
+
 
 class Config:
     """
@@ -20,6 +34,20 @@ class Config:
     and provides type-safe access to settings.
     """
     
+    # One long-lived instance read from every command handler; slots
+    # make those reads a fixed-offset lookup instead of a dict probe
+    __slots__ = (
+        'discord_token', 'command_prefix', 'bot_status', 'database_path',
+        'llm_provider', 'ollama_base_url', 'ollama_model',
+        'openrouter_api_key', 'openrouter_model', 'openai_api_key',
+        'openai_model', 'log_level', 'log_file', 'max_message_length',
+        'max_embed_fields', 'cleanup_interval_hours', 'use_uvloop',
+        'command_cooldowns', 'view_timeouts', 'max_errors_before_restart',
+        'error_log_retention_days', 'cache_enabled', 'cache_ttl_seconds',
+        'cache_max_size', 'game_config', 'embed_colors', 'color_success',
+        'color_error', 'color_warning', 'color_info'
+    )
+    
     def __init__(self):
         """Initialize configuration from environment variables."""
         self._load_config()
@@ -51,6 +79,7 @@ class Config:
         self.max_message_length = int(self._get_env('MAX_MESSAGE_LENGTH', '2000'))
         self.max_embed_fields = int(self._get_env('MAX_EMBED_FIELDS', '25'))
         self.cleanup_interval_hours = int(self._get_env('CLEANUP_INTERVAL_HOURS', '1'))
+        self.use_uvloop = self._get_env('USE_UVLOOP', 'true').lower() == 'true'
         
         # Rate Limiting Configuration
         self.command_cooldowns = self._load_cooldowns()
@@ -70,6 +99,13 @@ class Config:
         
         # Embed Colors
         self.embed_colors = self._load_embed_colors()
+        
+        # Hot colors promoted to plain attributes; callers on embed-send
+        # paths read these directly, get_color stays for dynamic names
+        self.color_success = self.embed_colors['success']
+        self.color_error = self.embed_colors['error']
+        self.color_warning = self.embed_colors['warning']
+        self.color_info = self.embed_colors['info']
     
     def _get_required_env(self, key: str) -> str:
         """Get a required environment variable."""
@@ -120,17 +156,12 @@ class Config:
     
     def _load_embed_colors(self) -> Dict[str, int]:
         """Load embed color configuration."""
-        return {
-            'success': int(self._get_env('COLOR_SUCCESS', '0x00ff00'), 16),
-            'error': int(self._get_env('COLOR_ERROR', '0xff0000'), 16),
-            'warning': int(self._get_env('COLOR_WARNING', '0xffa500'), 16),
-            'info': int(self._get_env('COLOR_INFO', '0x0099ff'), 16),
-            'combat': int(self._get_env('COLOR_COMBAT', '0xff4444'), 16),
-            'victory': int(self._get_env('COLOR_VICTORY', '0x00ff00'), 16),
-            'defeat': int(self._get_env('COLOR_DEFEAT', '0x8b0000'), 16),
-            'inventory': int(self._get_env('COLOR_INVENTORY', '0xffd700'), 16),
-            'status': int(self._get_env('COLOR_STATUS', '0x0099ff'), 16)
-        }
+        colors = dict(_DEFAULT_COLORS)
+        for name in _DEFAULT_COLORS:
+            value = os.getenv(f'COLOR_{name.upper()}')
+            if value is not None:
+                colors[name] = int(value, 16)
+        return colors
     
     def validate(self) -> None:
         """Validate the configuration."""
@@ -5,13 +5,19 @@ Provides structured logging with proper formatting, file rotation,
 and different log levels for production use.
 """
 
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Listener thread draining the log queue to the real handlers; module
+# state so shutdown_logging can stop it cleanly
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -53,7 +59,8 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    handlers = [console_handler]
     
     # File handler with rotation
     if log_file:
@@ -65,7 +72,20 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Emitters only enqueue the record; a background listener thread
+    # does the console/disk I/O so log calls never stall the event loop
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Set specific loggers to appropriate levels
     logging.getLogger('discord').setLevel(logging.WARNING)
@@ -79,10 +99,22 @@ def setup_logging(
         logger.info(f"Log file: {log_file}")
 
 
+def shutdown_logging() -> None:
+    """Stop the queue listener, flushing any pending records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+@functools.lru_cache(maxsize=128)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
     
+    Memoized: loggers are process-global and idempotent, so the cache
+    skips logging.getLogger's lock on repeat lookups.
+    
     Args:
         name: The logger name
         
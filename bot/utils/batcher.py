@@ -0,0 +1,138 @@
+"""
+Outbound message batching for the Discord bot.
+
+Coalesces bursts of sends to the same channel and dispatches them
+together under a semaphore sized to Discord's per-channel rate-limit
+bucket, instead of firing sequential HTTP requests.
+"""
+
+import asyncio
+
+from ..core.logger import get_logger
+
+# Discord allows roughly 5 messages per 5 seconds per channel
+_CHANNEL_BUCKET_SIZE = 5
+
+# Seconds an idle per-channel worker waits before retiring
+_WORKER_IDLE_TIMEOUT = 300.0
+
+
+class AsyncBatcher:
+    """
+    Per-channel outbound send coalescer.
+
+    Sends enqueued within a short window are popped as one batch by a
+    per-channel worker task and dispatched concurrently. Callers await
+    the returned future exactly as they would await channel.send.
+    """
+
+    def __init__(self, max_wait_ms: int = 25, max_batch: int = 10):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_wait_ms: How long a batch waits for more sends, in ms
+            max_batch: Maximum sends dispatched per batch
+        """
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+        self.logger = get_logger(__name__)
+        self._queues = {}
+        self._workers = {}
+        self._closed = False
+
+    def send(self, channel, **kwargs):
+        """
+        Enqueue a send to a channel.
+
+        Args:
+            channel: Destination messageable channel
+            **kwargs: Keyword arguments forwarded to channel.send
+
+        Returns:
+            Future resolving to the sent message
+        """
+        loop = asyncio.get_running_loop()
+        if self._closed:
+            # Shutting down: skip coalescing and send directly
+            return loop.create_task(channel.send(**kwargs))
+        future = loop.create_future()
+
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = asyncio.Queue()
+            self._workers[channel.id] = loop.create_task(
+                self._worker(channel.id)
+            )
+        queue.put_nowait((channel, kwargs, future))
+        return future
+
+    async def _worker(self, channel_id):
+        """Drain one channel's queue in coalesced batches."""
+        queue = self._queues[channel_id]
+        semaphore = asyncio.Semaphore(_CHANNEL_BUCKET_SIZE)
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    batch = [await asyncio.wait_for(
+                        queue.get(), timeout=_WORKER_IDLE_TIMEOUT
+                    )]
+                except asyncio.TimeoutError:
+                    # Idle channel: retire the worker and its queue
+                    return
+
+                # Collect whatever else arrives inside the window
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(
+                            queue.get(), timeout=remaining
+                        ))
+                    except asyncio.TimeoutError:
+                        break
+
+                await asyncio.gather(*(
+                    self._dispatch(semaphore, channel, kwargs, future)
+                    for channel, kwargs, future in batch
+                ))
+        finally:
+            # Unregister first, then drain: a send() racing the idle
+            # timeout may have landed on this queue, and its future must
+            # not be stranded. New sends from here on get a fresh worker.
+            self._queues.pop(channel_id, None)
+            self._workers.pop(channel_id, None)
+            leftovers = []
+            while not queue.empty():
+                leftovers.append(queue.get_nowait())
+            if leftovers:
+                await asyncio.gather(*(
+                    self._dispatch(semaphore, channel, kwargs, future)
+                    for channel, kwargs, future in leftovers
+                ))
+
+    async def close(self):
+        """Retire all workers, dispatching any queued sends first."""
+        self._closed = True
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            # Each worker's finally block drains its queue on the way out
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _dispatch(self, semaphore, channel, kwargs, future):
+        """Perform one send and resolve its caller's future."""
+        async with semaphore:
+            try:
+                message = await channel.send(**kwargs)
+            except Exception as e:
+                self.logger.error(f"Error in batched send: {e}", exc_info=True)
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(message)
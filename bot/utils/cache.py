@@ -5,6 +5,7 @@ Provides in-memory caching with TTL support to reduce redundant
 API calls and improve performance.
 """
 
+import asyncio
 import time
 import threading
 from typing import Any, Optional, Dict, Tuple
@@ -206,6 +207,31 @@ class CacheManager:
             return
         self.command_results.set(key, result, ttl)
     
+    async def get_or_compute(self, key: str, compute, ttl: Optional[int] = None) -> Tuple[Any, bool]:
+        """
+        Get a cached command result, computing and storing it on a miss.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument callable (sync or async) producing the value
+            ttl: Time-to-live for a freshly computed value
+            
+        Returns:
+            Tuple of (value, was_cached)
+        """
+        if self.enabled:
+            cached = self.command_results.get(key)
+            if cached is not None:
+                return cached, True
+        
+        result = compute()
+        if asyncio.iscoroutine(result):
+            result = await result
+        
+        if self.enabled:
+            self.command_results.set(key, result, ttl)
+        return result, False
+    
     def invalidate_user_data(self, user_id: int) -> None:
         """Invalidate cached user data."""
         if self.enabled:
@@ -216,6 +242,13 @@ class CacheManager:
         if self.enabled:
             self.game_state.delete(str(user_id))
     
+    def invalidate_many(self, keys) -> None:
+        """Invalidate several cached game-state keys in one call."""
+        if self.enabled:
+            delete = self.game_state.delete
+            for key in keys:
+                delete(str(key))
+    
     def cleanup_all(self) -> Dict[str, int]:
         """Clean up all caches and return cleanup statistics."""
         if not self.enabled:
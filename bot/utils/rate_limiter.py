@@ -7,6 +7,7 @@ hitting Discord API limits and ensure fair usage.
 
 import time
 import asyncio
+import threading
 from typing import Dict, Optional, Tuple
 from collections import defaultdict, deque
 from dataclasses import dataclass
@@ -22,6 +23,11 @@ class RateLimit:
     cooldown_seconds: int = 0
 
 
+# Wheel-timer tick size in seconds. Keys are bucketed by which tick they
+# expire in so cleanup() only walks due buckets, not every tracked key.
+WHEEL_TICK = 60.0
+
+
 class RateLimiter:
     """
     Rate limiter for managing API calls and command usage.
@@ -32,8 +38,20 @@ class RateLimiter:
     
     def __init__(self):
         """Initialize the rate limiter."""
+        # cleanup() runs via asyncio.to_thread while the event loop keeps
+        # calling is_allowed/set_cooldown; the lock keeps the dicts and
+        # deques consistent across the two threads
+        self._lock = threading.Lock()
         self._requests: Dict[str, deque] = defaultdict(deque)
         self._cooldowns: Dict[str, float] = {}
+        # Timer-wheel buckets: tick index -> keys that may expire that tick
+        self._cooldown_buckets: Dict[int, set] = defaultdict(set)
+        self._request_buckets: Dict[int, set] = defaultdict(set)
+    
+    @staticmethod
+    def _tick(expiry: float) -> int:
+        """Get the wheel bucket index for an expiry time."""
+        return int(expiry // WHEEL_TICK)
     
     def is_allowed(self, key: str, limit: RateLimit) -> Tuple[bool, Optional[float]]:
         """
@@ -46,33 +64,35 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, retry_after_seconds)
         """
-        current_time = time.time()
-        
-        # Check cooldown first
-        if key in self._cooldowns:
-            cooldown_until = self._cooldowns[key]
-            if current_time < cooldown_until:
-                return False, cooldown_until - current_time
-        
-        # Get request history
-        requests = self._requests[key]
-        
-        # Remove expired requests
-        window_start = current_time - limit.window_seconds
-        while requests and requests[0] < window_start:
-            requests.popleft()
-        
-        # Check if under limit
-        if len(requests) < limit.max_requests:
-            requests.append(current_time)
-            return True, None
-        
-        # Rate limited
-        if requests:
-            retry_after = requests[0] + limit.window_seconds - current_time
-            return False, max(0, retry_after)
-        
-        return False, limit.window_seconds
+        with self._lock:
+            current_time = time.time()
+        
+            # Check cooldown first, dropping it lazily once expired
+            cooldown_until = self._cooldowns.get(key)
+            if cooldown_until is not None:
+                if current_time < cooldown_until:
+                    return False, cooldown_until - current_time
+                del self._cooldowns[key]
+        
+            # Get request history (entries store their expiry time)
+            requests = self._requests[key]
+        
+            # Remove expired requests
+            while requests and requests[0] <= current_time:
+                requests.popleft()
+        
+            # Check if under limit
+            if len(requests) < limit.max_requests:
+                expiry = current_time + limit.window_seconds
+                requests.append(expiry)
+                self._request_buckets[self._tick(expiry)].add(key)
+                return True, None
+        
+            # Rate limited
+            if requests:
+                return False, max(0, requests[0] - current_time)
+        
+            return False, limit.window_seconds
     
     def set_cooldown(self, key: str, cooldown_seconds: int) -> None:
         """
@@ -82,7 +102,10 @@ class RateLimiter:
             key: Unique identifier
             cooldown_seconds: Cooldown duration in seconds
         """
-        self._cooldowns[key] = time.time() + cooldown_seconds
+        with self._lock:
+            expiry = time.time() + cooldown_seconds
+            self._cooldowns[key] = expiry
+            self._cooldown_buckets[self._tick(expiry)].add(key)
     
     def get_remaining_requests(self, key: str, limit: RateLimit) -> int:
         """
@@ -95,15 +118,18 @@ class RateLimiter:
         Returns:
             Number of remaining requests
         """
-        current_time = time.time()
-        requests = self._requests[key]
-        
-        # Remove expired requests
-        window_start = current_time - limit.window_seconds
-        while requests and requests[0] < window_start:
-            requests.popleft()
-        
-        return max(0, limit.max_requests - len(requests))
+        with self._lock:
+            current_time = time.time()
+            requests = self._requests[key]
+        
+            # Remove expired requests, dropping the queue once it empties
+            while requests and requests[0] <= current_time:
+                requests.popleft()
+            if not requests:
+                del self._requests[key]
+                return limit.max_requests
+        
+            return max(0, limit.max_requests - len(requests))
     
     def reset(self, key: str) -> None:
         """
@@ -112,10 +138,17 @@ class RateLimiter:
         Args:
             key: Unique identifier
         """
-        if key in self._requests:
-            del self._requests[key]
-        if key in self._cooldowns:
-            del self._cooldowns[key]
+        with self._lock:
+            if key in self._requests:
+                del self._requests[key]
+            if key in self._cooldowns:
+                del self._cooldowns[key]
+    
+    @property
+    def active_count(self) -> int:
+        """Number of tracked request queues and cooldowns, without mutating."""
+        with self._lock:
+            return len(self._requests) + len(self._cooldowns)
     
     def cleanup(self) -> int:
         """
@@ -124,28 +157,34 @@ class RateLimiter:
         Returns:
             Number of keys cleaned up
         """
-        current_time = time.time()
-        cleaned_keys = 0
-        
-        # Clean up expired cooldowns
-        expired_cooldowns = [
-            key for key, expiry in self._cooldowns.items()
-            if current_time > expiry
-        ]
-        for key in expired_cooldowns:
-            del self._cooldowns[key]
-            cleaned_keys += 1
-        
-        # Clean up empty request queues
-        empty_keys = [
-            key for key, requests in self._requests.items()
-            if not requests
-        ]
-        for key in empty_keys:
-            del self._requests[key]
-            cleaned_keys += 1
-        
-        return cleaned_keys
+        with self._lock:
+            current_time = time.time()
+            current_tick = self._tick(current_time)
+            cleaned_keys = 0
+        
+            # Pop due cooldown buckets. A key whose cooldown was refreshed since
+            # being bucketed also sits in a later bucket, so only drop entries
+            # that have actually expired.
+            for tick in [t for t in self._cooldown_buckets if t <= current_tick]:
+                for key in self._cooldown_buckets.pop(tick):
+                    expiry = self._cooldowns.get(key)
+                    if expiry is not None and current_time > expiry:
+                        del self._cooldowns[key]
+                        cleaned_keys += 1
+        
+            # Pop due request buckets and drop queues that prune down to empty
+            for tick in [t for t in self._request_buckets if t <= current_tick]:
+                for key in self._request_buckets.pop(tick):
+                    requests = self._requests.get(key)
+                    if requests is None:
+                        continue
+                    while requests and requests[0] <= current_time:
+                        requests.popleft()
+                    if not requests:
+                        del self._requests[key]
+                        cleaned_keys += 1
+        
+            return cleaned_keys
 
 
 class CommandRateLimiter:
@@ -201,6 +240,32 @@ class CommandRateLimiter:
         
         return self.rate_limiter.is_allowed(key, limit)
     
+    def try_acquire(self, user_id: int, command: str) -> Tuple[bool, Optional[float]]:
+        """
+        Atomically check a command's rate limit and record its cooldown.
+        
+        Combines check_command and set_command_cooldown so concurrent
+        invocations from the same user cannot both pass the check before
+        either records a cooldown.
+        
+        Args:
+            user_id: Discord user ID
+            command: Command name
+            
+        Returns:
+            Tuple of (can_execute, retry_after_seconds)
+        """
+        if command not in self._command_limits:
+            return True, None
+        
+        key = f"{user_id}:{command}"
+        limit = self._command_limits[command]
+        
+        allowed, retry_after = self.rate_limiter.is_allowed(key, limit)
+        if allowed:
+            self.rate_limiter.set_cooldown(key, limit.cooldown_seconds)
+        return allowed, retry_after
+    
     def set_command_cooldown(self, user_id: int, command: str) -> None:
         """
         Set a cooldown for a user's command.
@@ -247,6 +312,11 @@ class CommandRateLimiter:
             key = f"{user_id}:{command}"
             self.rate_limiter.reset(key)
     
+    @property
+    def active_count(self) -> int:
+        """Number of tracked entries, for read-only stats."""
+        return self.rate_limiter.active_count
+    
     def cleanup(self) -> int:
         """
         Clean up expired rate limit data.
@@ -311,6 +381,11 @@ class APIRateLimiter:
         key = f"guild:{guild_id}:{endpoint}" if guild_id else f"global:{endpoint}"
         self.rate_limiter.set_cooldown(key, cooldown_seconds)
     
+    @property
+    def active_count(self) -> int:
+        """Number of tracked entries, for read-only stats."""
+        return self.rate_limiter.active_count
+    
     def cleanup(self) -> int:
         """
         Clean up expired rate limit data.
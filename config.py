@@ -18,6 +18,16 @@ if TELEGRAM_TOKEN == 'your_telegram_bot_token_here':
         "Set the TELEGRAM_TOKEN environment variable: export TELEGRAM_TOKEN=your_actual_token"
     )
 
+# Number of worker threads for running blocking game-engine calls
+WORKERS = int(os.getenv('WORKERS', '4'))
+
+# Webhook Configuration
+# When PUBLIC_URL is set, the bot receives updates via webhook instead of
+# long polling. Leave it empty to keep polling (e.g. for local development).
+PUBLIC_URL = os.getenv('PUBLIC_URL', '')
+WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', '8443'))
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET', '')
+
 # LLM Configuration
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'ollama')  # 'ollama', 'openrouter', or 'openai'
 OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
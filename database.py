@@ -21,9 +21,27 @@ class DatabaseManager:
         self.db_path = db_path or config.DATABASE_PATH
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with per-connection performance pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+    
+    def apply_pragmas(self):
+        """Switch the database to WAL journaling for better read concurrency.
+        
+        The journal mode is persistent, so this only needs to run once per
+        database file; the remaining pragmas are applied per connection.
+        """
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+    
     def init_database(self):
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Players table
@@ -110,7 +128,7 @@ class DatabaseManager:
         Returns:
             Dictionary containing player data
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Check if player exists
@@ -199,7 +217,7 @@ class DatabaseManager:
         Returns:
             Dictionary containing player stats or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -232,7 +250,7 @@ class DatabaseManager:
             user_id: Telegram user ID
             **kwargs: Stats to update (health, max_health, level, experience, gold)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Build update query dynamically
@@ -256,7 +274,7 @@ class DatabaseManager:
         Returns:
             List of inventory items
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -274,7 +292,11 @@ class DatabaseManager:
                     'effect': row[2],
                     'value': row[3],
                     'description': row[4],
-                    'quantity': row[5]
+                    'quantity': row[5],
+                    # Title-cased once here so renderers don't re-case the
+                    # same strings on every view
+                    'type_title': row[1].title(),
+                    'effect_title': row[2].title()
                 })
             
             return items
@@ -287,7 +309,7 @@ class DatabaseManager:
             item_data: Item data dictionary
             quantity: Number of items to add
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Check if item already exists
@@ -326,7 +348,7 @@ class DatabaseManager:
         Returns:
             True if successful, False if not enough items
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Check current quantity
@@ -365,7 +387,7 @@ class DatabaseManager:
             user_id: Telegram user ID
             enemy_data: Enemy data dictionary
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Create combat session
@@ -391,7 +413,7 @@ class DatabaseManager:
         Args:
             user_id: Telegram user ID
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Update game state
@@ -411,7 +433,7 @@ class DatabaseManager:
         Returns:
             Combat session data or None if not in combat
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -444,7 +466,7 @@ class DatabaseManager:
             user_id: Telegram user ID
             enemy_health: New enemy health value
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -463,7 +485,7 @@ class DatabaseManager:
             user_id: Telegram user ID
             progress: New story progress value
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -482,7 +504,7 @@ class DatabaseManager:
         timeout = timeout_minutes or config.GAME_CONFIG['session_timeout_minutes']
         cutoff_time = datetime.now() - timedelta(minutes=timeout)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # End combat sessions for inactive players
@@ -504,7 +526,7 @@ class DatabaseManager:
         """
         import os
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Get total players
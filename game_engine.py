@@ -67,6 +67,8 @@ class GameEngine:
         return {
             'stats': stats,
             'inventory': inventory,
+            # Precomputed so status-only consumers never touch the list
+            'inventory_count': len(inventory),
             'in_combat': bool(combat_session),
             'combat_info': combat_session
         }
@@ -15,6 +15,9 @@ class LLMClient:
     def __init__(self):
         """Initialize the LLM client based on configuration."""
         self.provider = config.LLM_PROVIDER
+        # Reuse one session so TCP/TLS connections to the LLM endpoint are
+        # kept alive instead of being re-established on every request.
+        self.session = requests.Session()
         self.available = self._test_connection()
     
     def _test_connection(self) -> bool:
@@ -25,7 +28,7 @@ class LLMClient:
         """
         try:
             if self.provider == 'ollama':
-                response = requests.get(f"{config.OLLAMA_BASE_URL}/api/tags", timeout=5)
+                response = self.session.get(f"{config.OLLAMA_BASE_URL}/api/tags", timeout=5)
                 return response.status_code == 200
             elif self.provider == 'openrouter':
                 # Test with a simple request
@@ -83,7 +86,7 @@ class LLMClient:
                 }
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{config.OLLAMA_BASE_URL}/api/generate",
                 json=payload,
                 timeout=30
@@ -121,7 +124,7 @@ class LLMClient:
                 "temperature": 0.8
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers=headers,
                 json=payload,
@@ -160,7 +163,7 @@ class LLMClient:
                 "temperature": 0.8
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers=headers,
                 json=payload,
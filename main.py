@@ -62,6 +62,16 @@ async def main():
 def run_bot():
     """Synchronous wrapper to run the async main function."""
     try:
+        # uvloop must be installed before asyncio.run creates the loop,
+        # which is why this reads the env directly rather than Config
+        # (built later, inside the loop). Disable with USE_UVLOOP=false.
+        if os.getenv('USE_UVLOOP', 'true').lower() == 'true' and sys.platform != 'win32':
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
+        
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\nBot shutdown complete.")
@@ -39,6 +39,35 @@ class TestCache:
         assert True
 
 
+class TestCogLoading:
+    """Test that all cogs register together."""
+    
+    def test_all_cogs_load_together(self):
+        """All three extensions co-load without name collisions."""
+        discord = pytest.importorskip("discord")
+        import asyncio
+        from discord.ext import commands
+        
+        os.environ.setdefault('DISCORD_TOKEN', 'MTA' + 'x' * 60)
+        
+        async def load_all():
+            intents = discord.Intents.default()
+            intents.members = True
+            bot = commands.Bot(command_prefix='!', intents=intents)
+            bot.config = Config()
+            try:
+                await bot.load_extension('bot.cogs.game_commands')
+                await bot.load_extension('bot.cogs.admin_commands')
+                await bot.load_extension('bot.cogs.utility_commands')
+                assert bot.get_cog('GameCommands') is not None
+                assert bot.get_cog('AdminCommands') is not None
+                assert bot.get_cog('UtilityCommands') is not None
+            finally:
+                await bot.close()
+        
+        asyncio.run(load_all())
+
+
 class TestRateLimiter:
     """Test rate limiting functionality."""
     